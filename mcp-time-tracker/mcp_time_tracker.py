@@ -6,158 +6,330 @@ This server provides tools to track work hours, manage timers, and generate time
 Perfect for freelancers, developers, and anyone who needs to log their work time.
 """
 
+import calendar
+import heapq
 import json
-import uuid
-from datetime import datetime, timedelta
+import os
+import shutil
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 mcp = FastMCP("Time Tracker")
 
+# Legacy single-file store, migrated on first load
 TIME_DATA_FILE = Path("time_tracker_data.json")
+STATE_FILE = Path("time_tracker_state.json")
+ENTRIES_FILE = Path("time_tracker_entries.jsonl")
 
+# Below this many entries the NumPy conversion costs more than the loop it replaces
+VECTORIZE_MIN_ENTRIES = 1000
 
-def rebuild_date_index(entries: list) -> Dict[str, list]:
-    """Rebuild date index from entries for faster date-based lookups"""
-    date_index = {}
-    for entry in entries:
-        date = entry.get("date")
-        if date:
-            if date not in date_index:
-                date_index[date] = []
-            date_index[date].append(entry["id"])
-    return date_index
-
-
-def update_date_index(data: Dict[str, Any], entry: Dict[str, Any]):
-    """Update date index when adding a new entry"""
-    date = entry.get("date")
-    if date and "date_index" in data:
-        if date not in data["date_index"]:
-            data["date_index"][date] = []
-        data["date_index"][date].append(entry["id"])
-
-
-def get_entries_by_date_range(data: Dict[str, Any], start_date: datetime, end_date: datetime) -> list:
-    """Get entries within date range using index for faster lookup"""
-    if "date_index" not in data or not data["date_index"]:
-        # Fallback to linear search if no index
-        return get_entries_by_date_range_linear(data["entries"], start_date, end_date)
-
-    relevant_entries = []
-    current_date = start_date.date()
-    end_date_only = end_date.date()
-
-    # Use date index to get relevant entry IDs
-    relevant_entry_ids = set()
-    while current_date <= end_date_only:
-        date_str = current_date.strftime("%Y-%m-%d")
-        if date_str in data["date_index"]:
-            relevant_entry_ids.update(data["date_index"][date_str])
-        current_date += timedelta(days=1)
-
-    # Get actual entries and filter by exact time range
-    entries_by_id = {entry["id"]: entry for entry in data["entries"]}
-    for entry_id in relevant_entry_ids:
-        if entry_id in entries_by_id:
-            entry = entries_by_id[entry_id]
-            entry_date = datetime.fromisoformat(entry["start_time"])
-            if start_date <= entry_date <= end_date:
-                relevant_entries.append(entry)
-
-    return relevant_entries
-
-
-def get_entries_by_date_range_linear(entries: list, start_date: datetime, end_date: datetime) -> list:
-    """Fallback linear search for entries within date range"""
-    relevant_entries = []
+
+DEFAULT_CATEGORIES = ["personal", "client", "learning", "meeting", "other"]
+STATE_KEYS = ("active_timer", "projects", "categories", "next_id")
+
+
+def default_state() -> Dict[str, Any]:
+    """Return a fresh copy of the default timer/project state"""
+    return {"active_timer": None, "projects": [], "categories": list(DEFAULT_CATEGORIES), "next_id": 1}
+
+
+def next_entry_id(data: Dict[str, Any]) -> str:
+    """Allocate the next entry ID from the persisted counter (single writer, so no collisions)"""
+    entry_id = data["next_id"]
+    data["next_id"] = entry_id + 1
+    return format(entry_id, "x")
+
+
+def backup_corrupted_file(path: Path):
+    """Move a file that failed to parse out of the way"""
+    backup_file = path.with_suffix(f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    try:
+        path.rename(backup_file)
+        print(f"Corrupted file backed up to: {backup_file}")
+    except Exception:
+        pass
+
+
+def dumps_json(payload: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON, using orjson when it is installed (its errors subclass json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def write_text_atomic(path: Path, text: str):
+    """Write text to a temp file and swap it in with os.replace"""
+    temp_file = path.with_suffix(".tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_file, path)
+
+
+def write_json_atomic(path: Path, payload: Any):
+    """Write compact JSON to a temp file and swap it in with os.replace"""
+    write_text_atomic(path, dumps_json(payload))
+
+
+def migrate_legacy_data():
+    """Split the legacy single-file store into a state file and an entries log"""
+    if STATE_FILE.exists() or not TIME_DATA_FILE.exists():
+        return
+
+    try:
+        with open(TIME_DATA_FILE, "r", encoding="utf-8") as f:
+            legacy = loads_json(f.read())
+    except json.JSONDecodeError as e:
+        print(f"Error: Failed to parse JSON in {TIME_DATA_FILE}: {e}")
+        backup_corrupted_file(TIME_DATA_FILE)
+        return
+
+    if not isinstance(legacy, dict):
+        print(f"Warning: Invalid data format in {TIME_DATA_FILE}, skipping migration")
+        return
+
+    entries = legacy.get("entries", [])
+    # Entries from before start_epoch existed get it once here rather than on every read
     for entry in entries:
-        entry_date = datetime.fromisoformat(entry["start_time"])
-        if start_date <= entry_date <= end_date:
-            relevant_entries.append(entry)
-    return relevant_entries
+        if "start_epoch" not in entry:
+            entry["start_epoch"] = int(datetime.fromisoformat(entry["start_time"]).timestamp())
+    save_entries(entries)
+    state = default_state()
+    state.update({key: legacy[key] for key in STATE_KEYS if key in legacy})
+    write_json_atomic(STATE_FILE, state)
+    TIME_DATA_FILE.rename(TIME_DATA_FILE.with_suffix(".migrated"))
+    print(f"Migrated {TIME_DATA_FILE} to {STATE_FILE} and {ENTRIES_FILE}")
 
 
-def load_time_data() -> Dict[str, Any]:
-    """Load time tracking data from JSON file"""
-    default_data = {
-        "active_timer": None,
-        "entries": [],
-        "projects": [],
-        "categories": ["personal", "client", "learning", "meeting", "other"],
-        "date_index": {},  # New: date -> list of entry IDs for faster lookups
-    }
+def load_state() -> Dict[str, Any]:
+    """Load timer, project and category state without touching entries"""
+    default_data = default_state()
 
-    if not TIME_DATA_FILE.exists():
+    try:
+        migrate_legacy_data()
+    except Exception as e:
+        print(f"Error: Failed to migrate legacy time data: {e}")
+
+    if not STATE_FILE.exists():
         return default_data
 
     try:
-        with open(TIME_DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            state = loads_json(f.read())
 
-        if not isinstance(data, dict):
-            print(f"Warning: Invalid data format in {TIME_DATA_FILE}, using defaults")
+        if not isinstance(state, dict):
+            print(f"Warning: Invalid data format in {STATE_FILE}, using defaults")
             return default_data
 
         for key in default_data:
-            if key not in data:
-                print(f"Warning: Missing key '{key}' in {TIME_DATA_FILE}, adding default")
-                data[key] = default_data[key]
-
-        # Rebuild date index if missing or incomplete
-        if not data.get("date_index") or len(data["date_index"]) == 0:
-            data["date_index"] = rebuild_date_index(data["entries"])
+            if key not in state:
+                print(f"Warning: Missing key '{key}' in {STATE_FILE}, adding default")
+                state[key] = default_data[key]
 
-        return data
+        return state
 
     except json.JSONDecodeError as e:
-        print(f"Error: Failed to parse JSON in {TIME_DATA_FILE}: {e}")
-        backup_file = TIME_DATA_FILE.with_suffix(f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        try:
-            TIME_DATA_FILE.rename(backup_file)
-            print(f"Corrupted file backed up to: {backup_file}")
-        except Exception:
-            pass
+        print(f"Error: Failed to parse JSON in {STATE_FILE}: {e}")
+        backup_corrupted_file(STATE_FILE)
         return default_data
 
     except Exception as e:
-        print(f"Error: Failed to load time data: {e}")
+        print(f"Error: Failed to load timer state: {e}")
         return default_data
 
 
+def iter_entries() -> Iterator[Dict[str, Any]]:
+    """Stream time entries from the append-only JSONL log one line at a time"""
+    if not ENTRIES_FILE.exists():
+        return
+
+    try:
+        with open(ENTRIES_FILE, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = loads_json(line)
+                except json.JSONDecodeError as e:
+                    print(f"Warning: Skipping corrupted entry on line {line_number} of {ENTRIES_FILE}: {e}")
+                    continue
+                yield entry
+    except Exception as e:
+        print(f"Error: Failed to load time entries: {e}")
+
+
+def load_entries() -> list:
+    """Load all time entries from the append-only JSONL log"""
+    return list(iter_entries())
+
+
+def load_time_data() -> Dict[str, Any]:
+    """Load timer state and all time entries"""
+    data = load_state()
+    data["entries"] = load_entries()
+    return data
+
+
 def save_time_data(data: Dict[str, Any]) -> bool:
-    """Save time tracking data to JSON file"""
+    """Save timer, project and category state (entries are persisted separately)"""
     try:
         if not isinstance(data, dict):
             print("Error: Cannot save invalid data format")
             return False
 
-        if TIME_DATA_FILE.exists():
-            backup_file = TIME_DATA_FILE.with_suffix(".backup")
-            try:
-                import shutil
+        state = dumps_json({key: data.get(key) for key in STATE_KEYS})
 
-                shutil.copy2(TIME_DATA_FILE, backup_file)
-            except Exception:
-                pass
+    except (TypeError, ValueError) as e:
+        print(f"Error: Failed to encode data as JSON: {e}")
+        return False
 
-        temp_file = TIME_DATA_FILE.with_suffix(".tmp")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+    # Keep the previous state around, the only way back from a bad write
+    if STATE_FILE.exists():
+        try:
+            shutil.copy2(STATE_FILE, STATE_FILE.with_suffix(".backup"))
+        except Exception:
+            pass
 
-        temp_file.replace(TIME_DATA_FILE)
+    try:
+        write_text_atomic(STATE_FILE, state)
         return True
+    except Exception as e:
+        print(f"Error: Failed to save time data: {e}")
+        return False
 
-    except json.JSONEncodeError as e:
-        print(f"Error: Failed to encode data as JSON: {e}")
+
+def append_entry(entry: Dict[str, Any]) -> bool:
+    """Append a single time entry to the JSONL log"""
+    try:
+        with open(ENTRIES_FILE, "a", encoding="utf-8") as f:
+            f.write(dumps_json(entry) + "\n")
+        return True
+    except Exception as e:
+        print(f"Error: Failed to save time entry: {e}")
         return False
+
+
+def save_entries(entries: list) -> bool:
+    """Rewrite the whole entries log, only needed when entries are removed"""
+    try:
+        temp_file = ENTRIES_FILE.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.writelines(dumps_json(entry) + "\n" for entry in entries)
+        os.replace(temp_file, ENTRIES_FILE)
+        return True
     except Exception as e:
-        print(f"Error: Failed to save time data: {e}")
+        print(f"Error: Failed to save time entries: {e}")
         return False
 
 
+class EntryTable:
+    """Columnar view of the entries log for aggregate queries"""
+
+    def __init__(self, entries: Iterator[Dict[str, Any]]):
+        project_ids: Dict[str, int] = {}
+        category_ids: Dict[str, int] = {}
+
+        start_epochs, durations, projects, categories = [], [], [], []
+        for entry in entries:
+            start_epochs.append(entry["start_epoch"])
+            durations.append(entry["duration_minutes"])
+            projects.append(project_ids.setdefault(entry["project"], len(project_ids)))
+            categories.append(category_ids.setdefault(entry["category"], len(category_ids)))
+
+        self.projects: list[str] = list(project_ids)
+        self.categories: list[str] = list(category_ids)
+        self.size = len(start_epochs)
+        self.vectorized = NUMPY_AVAILABLE and self.size >= VECTORIZE_MIN_ENTRIES
+
+        if self.vectorized:
+            self.start_epochs = np.asarray(start_epochs, dtype=np.int64)
+            self.durations = np.asarray(durations, dtype=np.int64)
+            self.project_ids = np.asarray(projects, dtype=np.int32)
+            self.category_ids = np.asarray(categories, dtype=np.int32)
+        else:
+            self.start_epochs = start_epochs
+            self.durations = durations
+            self.project_ids = projects
+            self.category_ids = categories
+
+    def totals(self, start_epoch: Optional[float] = None, end_epoch: Optional[float] = None) -> tuple[int, Dict[str, int], Dict[str, int]]:
+        """Return (entry count, minutes per project, minutes per category) within an optional epoch range"""
+        if self.vectorized:
+            return self._totals_vectorized(start_epoch, end_epoch)
+
+        count = 0
+        project_minutes = defaultdict(int)
+        category_minutes = defaultdict(int)
+        for start, duration, project_id, category_id in zip(self.start_epochs, self.durations, self.project_ids, self.category_ids):
+            if (start_epoch is not None and start < start_epoch) or (end_epoch is not None and start > end_epoch):
+                continue
+            count += 1
+            project_minutes[self.projects[project_id]] += duration
+            category_minutes[self.categories[category_id]] += duration
+
+        return count, dict(project_minutes), dict(category_minutes)
+
+    def _totals_vectorized(self, start_epoch: Optional[float], end_epoch: Optional[float]) -> tuple[int, Dict[str, int], Dict[str, int]]:
+        mask = np.ones(self.size, dtype=bool)
+        if start_epoch is not None:
+            mask &= self.start_epochs >= start_epoch
+        if end_epoch is not None:
+            mask &= self.start_epochs <= end_epoch
+
+        durations = self.durations[mask]
+        project_minutes = np.bincount(self.project_ids[mask], weights=durations, minlength=len(self.projects))
+        category_minutes = np.bincount(self.category_ids[mask], weights=durations, minlength=len(self.categories))
+
+        project_totals = {name: int(minutes) for name, minutes in zip(self.projects, project_minutes) if minutes}
+        category_totals = {name: int(minutes) for name, minutes in zip(self.categories, category_minutes) if minutes}
+        return int(mask.sum()), project_totals, category_totals
+
+
+_entry_table_cache: Optional[tuple[tuple[int, int], EntryTable]] = None
+
+
+def load_entry_table() -> EntryTable:
+    """Get the columnar entry table, rebuilt only when the entries log changes on disk"""
+    global _entry_table_cache
+
+    try:
+        stat = ENTRIES_FILE.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        key = (0, 0)
+
+    if _entry_table_cache is None or _entry_table_cache[0] != key:
+        _entry_table_cache = (key, EntryTable(iter_entries()))
+
+    return _entry_table_cache[1]
+
+
 def parse_duration_input(duration_str: str) -> Optional[int]:
     """Parse duration input and return minutes"""
     duration_str = duration_str.lower().strip()
@@ -199,34 +371,33 @@ def format_duration(minutes: int) -> str:
         return f"{hours}h {mins}m"
 
 
-def get_date_range(period: str) -> tuple[datetime, datetime]:
-    """Get start and end datetime for a period"""
-    now = datetime.now()
+@lru_cache(maxsize=16)
+def _date_range_for_day(period: str, today: date) -> tuple[datetime, datetime]:
+    """Compute the start/end datetimes of a period relative to a given day"""
+    today_midnight = datetime.combine(today, time.min)
 
-    if period == "today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-    elif period == "yesterday":
-        yesterday = now - timedelta(days=1)
-        start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
+    if period == "yesterday":
+        start = today_midnight - timedelta(days=1)
+        days = 1
     elif period == "week":
-        days_since_monday = now.weekday()
-        start = (now - timedelta(days=days_since_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-        end = (start + timedelta(days=6)).replace(hour=23, minute=59, second=59, microsecond=999999)
+        start = today_midnight - timedelta(days=today.weekday())
+        days = 7
     elif period == "month":
-        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        if now.month == 12:
-            end = now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(microseconds=1)
-        else:
-            end = now.replace(month=now.month + 1, day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(microseconds=1)
+        start = today_midnight.replace(day=1)
+        days = calendar.monthrange(today.year, today.month)[1]
     else:
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+        start = today_midnight
+        days = 1
 
+    end = start + timedelta(days=days, microseconds=-1)
     return start, end
 
 
+def get_date_range(period: str) -> tuple[datetime, datetime]:
+    """Get start and end datetime for a period"""
+    return _date_range_for_day(period, date.today())
+
+
 @mcp.tool()
 async def start_timer(project: str, category: str = "personal", description: str = "") -> str:
     """
@@ -240,12 +411,13 @@ async def start_timer(project: str, category: str = "personal", description: str
     Returns:
         Timer start confirmation
     """
-    data = load_time_data()
+    data = load_state()
 
     if data["active_timer"]:
         stop_result = await stop_timer()
         if "Error" in stop_result:
             return f"Failed to stop existing timer: {stop_result}"
+        data = load_state()
 
     if category not in data["categories"]:
         data["categories"].append(category)
@@ -269,7 +441,7 @@ async def stop_timer() -> str:
     Returns:
         Timer stop confirmation with duration
     """
-    data = load_time_data()
+    data = load_state()
 
     if not data["active_timer"]:
         return "No active timer to stop"
@@ -282,18 +454,20 @@ async def stop_timer() -> str:
         return "Timer stopped (duration less than 1 minute, not saved)"
 
     entry = {
-        "id": str(uuid.uuid4()),
+        "id": next_entry_id(data),
         "project": data["active_timer"]["project"],
         "category": data["active_timer"]["category"],
         "start_time": data["active_timer"]["start_time"],
+        "start_epoch": int(start_time.timestamp()),
         "end_time": end_time.isoformat(),
         "duration_minutes": duration_minutes,
         "description": data["active_timer"]["description"],
         "date": start_time.strftime("%Y-%m-%d"),
     }
 
-    data["entries"].append(entry)
-    update_date_index(data, entry)  # Update date index
+    if not append_entry(entry):
+        return "Error: Failed to save time entry"
+
     data["active_timer"] = None
 
     if save_time_data(data):
@@ -310,7 +484,7 @@ async def get_timer_status() -> str:
     Returns:
         Current timer information or no timer message
     """
-    data = load_time_data()
+    data = load_state()
 
     if not data["active_timer"]:
         return "No active timer"
@@ -341,7 +515,7 @@ async def log_time(project: str, duration: str, category: str = "personal", desc
     Returns:
         Logging confirmation
     """
-    data = load_time_data()
+    data = load_state()
 
     duration_minutes = parse_duration_input(duration)
     if duration_minutes is None:
@@ -364,22 +538,21 @@ async def log_time(project: str, duration: str, category: str = "personal", desc
     if project not in data["projects"]:
         data["projects"].append(project)
 
+    start_time = log_date.replace(hour=9, minute=0)
     entry = {
-        "id": str(uuid.uuid4()),
+        "id": next_entry_id(data),
         "project": project,
         "category": category,
-        "start_time": log_date.replace(hour=9, minute=0).isoformat(),
-        "end_time": (log_date.replace(hour=9, minute=0) + timedelta(minutes=duration_minutes)).isoformat(),
+        "start_time": start_time.isoformat(),
+        "start_epoch": int(start_time.timestamp()),
+        "end_time": (start_time + timedelta(minutes=duration_minutes)).isoformat(),
         "duration_minutes": duration_minutes,
         "description": description,
         "date": log_date.strftime("%Y-%m-%d"),
         "manual_entry": True,
     }
 
-    data["entries"].append(entry)
-    update_date_index(data, entry)  # Update date index
-
-    if save_time_data(data):
+    if append_entry(entry) and save_time_data(data):
         return f"Logged {format_duration(duration_minutes)} for '{project}' on {log_date.strftime('%Y-%m-%d')}"
     else:
         return "Error: Failed to save time entry"
@@ -396,28 +569,14 @@ async def get_time_summary(period: str = "today") -> str:
     Returns:
         Time summary report
     """
-    data = load_time_data()
-
     start_date, end_date = get_date_range(period)
 
-    # Use optimized date range search
-    relevant_entries = get_entries_by_date_range(data, start_date, end_date)
+    entry_count, project_totals, category_totals = load_entry_table().totals(start_date.timestamp(), end_date.timestamp())
 
-    if not relevant_entries:
+    if not entry_count:
         return f"No time entries found for {period}"
 
-    total_minutes = sum(entry["duration_minutes"] for entry in relevant_entries)
-
-    project_totals = {}
-    category_totals = {}
-
-    for entry in relevant_entries:
-        project = entry["project"]
-        category = entry["category"]
-        duration = entry["duration_minutes"]
-
-        project_totals[project] = project_totals.get(project, 0) + duration
-        category_totals[category] = category_totals.get(category, 0) + duration
+    total_minutes = sum(project_totals.values())
 
     period_title = period.title()
     if period == "today":
@@ -451,17 +610,11 @@ async def list_projects() -> str:
     Returns:
         List of projects with total time
     """
-    data = load_time_data()
+    entry_count, project_totals, _ = load_entry_table().totals()
 
-    if not data["entries"]:
+    if not entry_count:
         return "No projects found. Start logging time to see projects here."
 
-    project_totals = {}
-    for entry in data["entries"]:
-        project = entry["project"]
-        duration = entry["duration_minutes"]
-        project_totals[project] = project_totals.get(project, 0) + duration
-
     result = "Your Projects:\n"
     result += "=" * 20 + "\n\n"
 
@@ -482,19 +635,16 @@ async def get_recent_entries(count: int = 5) -> str:
     Returns:
         List of recent time entries
     """
-    data = load_time_data()
+    recent_entries = heapq.nlargest(count, iter_entries(), key=lambda x: x["start_epoch"])
 
-    if not data["entries"]:
+    if not recent_entries:
         return "No time entries found"
 
-    sorted_entries = sorted(data["entries"], key=lambda x: x["start_time"], reverse=True)
-    recent_entries = sorted_entries[:count]
-
     result = f"Recent Time Entries (last {count}):\n"
     result += "=" * 30 + "\n\n"
 
     for entry in recent_entries:
-        start_time = datetime.fromisoformat(entry["start_time"])
+        start_time = datetime.fromtimestamp(entry["start_epoch"])
         date_str = start_time.strftime("%Y-%m-%d")
         time_str = start_time.strftime("%H:%M")
 
@@ -515,17 +665,15 @@ async def delete_last_entry() -> str:
     Returns:
         Deletion confirmation
     """
-    data = load_time_data()
+    entries = load_entries()
 
-    if not data["entries"]:
+    if not entries:
         return "No entries to delete"
 
-    sorted_entries = sorted(data["entries"], key=lambda x: x["start_time"], reverse=True)
-    last_entry = sorted_entries[0]
-
-    data["entries"] = [e for e in data["entries"] if e["id"] != last_entry["id"]]
+    last_index = max(range(len(entries)), key=lambda i: entries[i]["start_epoch"])
+    last_entry = entries.pop(last_index)
 
-    if save_time_data(data):
+    if save_entries(entries):
         return f"Deleted entry: {last_entry['project']} ({format_duration(last_entry['duration_minutes'])})"
     else:
         return "Error: Failed to delete entry"
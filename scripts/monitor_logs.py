@@ -14,7 +14,7 @@ import os
 import re
 import sys
 import time
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 
 # ANSI color codes for terminal output
 COLORS = {
@@ -52,19 +52,93 @@ def get_log_files() -> Dict[str, str]:
     return log_files
 
 
-def tail_file(file_path: str, num_lines: int = 10) -> List[str]:
-    """Read the last n lines from a file."""
+def tail_file(file_path: str, num_lines: int = 10, chunk_size: int = 8192) -> List[str]:
+    """Read the last n lines from a file.
+
+    Reads backwards from the end of the file in binary chunks, so only the
+    bytes covering the requested lines are read and decoded.
+    """
+    if num_lines <= 0:
+        return []
+
     try:
-        with open(file_path, "r") as f:
-            lines = f.readlines()
-            return lines[-num_lines:] if lines else []
+        with open(file_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            data = b""
+            # One extra newline is needed to know the first kept line is complete
+            while pos > 0 and data.count(b"\n") <= num_lines:
+                read_size = min(chunk_size, pos)
+                pos -= read_size
+                f.seek(pos, os.SEEK_SET)
+                data = f.read(read_size) + data
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
         return []
 
+    lines = data.splitlines(keepends=True)
+    return [line.decode("utf-8", errors="replace") for line in lines[-num_lines:]]
+
+
+def scan_file_stats(files: Dict[str, str]) -> Dict[str, os.stat_result]:
+    """Get the current stat result of each monitored file that exists.
+
+    Uses one os.scandir() pass per directory instead of an exists() + getsize()
+    pair of stat calls per file.
+    """
+    tracked_by_dir: Dict[str, set] = {}
+    for path in files.values():
+        tracked_by_dir.setdefault(os.path.dirname(path), set()).add(path)
+
+    stats = {}
+    for directory, tracked in tracked_by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    path = os.path.join(directory, entry.name)
+                    if path in tracked:
+                        try:
+                            stats[path] = entry.stat()
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+
+    return stats
+
+
+def print_new_lines(name: str, content: bytes, filter_text: Optional[str]) -> None:
+    """Print new log lines, decoding only those that pass the filter."""
+    # bytes.lower() only folds ASCII, so a non-ASCII filter is matched on decoded lines
+    filter_bytes = filter_text.encode("utf-8") if filter_text and filter_text.isascii() else None
+    for raw_line in content.splitlines():
+        if filter_bytes is not None:
+            if filter_bytes not in raw_line.lower():
+                continue
+            line = raw_line.decode("utf-8", errors="replace")
+        else:
+            line = raw_line.decode("utf-8", errors="replace")
+            if filter_text and filter_text not in line.lower():
+                continue
+
+        # Parse timestamp if present
+        timestamp_match = re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)
+        if timestamp_match:
+            timestamp = timestamp_match.group(1)
+            rest_of_line = line[len(timestamp) :]
+            print(f"{color_text(timestamp, 'GREEN')} {color_text(name, 'CYAN')}{rest_of_line}")
+        else:
+            print(f"{color_text(name, 'CYAN')}: {line}")
+
 
 def monitor_logs(files: Dict[str, str], interval: int = 2, filter_text: Optional[str] = None) -> None:
-    """Monitor log files for changes and print new lines."""
+    """Monitor log files for changes and print new lines.
+
+    Each file is kept open between polls. A changed inode means the log was
+    rotated: whatever was still unread in the old file is drained before the
+    new file is opened from the start. A size below the last read position
+    means the file was truncated, so reading restarts from the beginning.
+    """
     print(color_text("Log File Monitor", "BOLD"))
     print(color_text("=" * 80, "BOLD"))
     print(f"Monitoring {len(files)} log files:")
@@ -81,43 +155,76 @@ def monitor_logs(files: Dict[str, str], interval: int = 2, filter_text: Optional
     print("Press Ctrl+C to exit")
     print(color_text("=" * 80, "BOLD"))
 
-    # Keep track of the last position in each file
-    file_positions = {path: os.path.getsize(path) if os.path.exists(path) else 0 for name, path in files.items()}
+    filter_text = filter_text.lower() if filter_text else None
+
+    open_files: Dict[str, BinaryIO] = {}
+    file_inodes: Dict[str, int] = {}
+
+    def open_log(path: str) -> Optional[BinaryIO]:
+        try:
+            handle = open(path, "rb")
+        except OSError:
+            return None
+        open_files[path] = handle
+        file_inodes[path] = os.fstat(handle.fileno()).st_ino
+        return handle
+
+    # Keep track of the last position in each file, skipping existing content
+    file_positions = {}
+    for path in files.values():
+        handle = open_log(path)
+        file_positions[path] = handle.seek(0, os.SEEK_END) if handle else 0
 
     try:
         while True:
             has_updates = False
+            current_stats = scan_file_stats(files)
 
             for name, path in files.items():
-                if not os.path.exists(path):
+                stat = current_stats.get(path)
+                handle = open_files.get(path)
+
+                # DirEntry.stat() reports st_ino as 0 on Windows, where only os.stat() fills it in
+                if handle is not None and stat is not None and not stat.st_ino:
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        stat = None
+
+                # Rotated or removed: drain the old file, then start over on the new one
+                if handle is not None and (stat is None or stat.st_ino != file_inodes[path]):
+                    handle.seek(file_positions[path])
+                    remaining = handle.read()
+                    if remaining:
+                        has_updates = True
+                        print_new_lines(name, remaining, filter_text)
+                    handle.close()
+                    del open_files[path]
+                    handle = None
+                    file_positions[path] = 0
+
+                if stat is None:
                     continue
 
-                # Check if file has been modified
-                current_size = os.path.getsize(path)
-                if current_size > file_positions[path]:
-                    has_updates = True
-
-                    # Read only the new content
-                    with open(path, "r") as f:
-                        f.seek(file_positions[path])
-                        new_content = f.read()
+                if handle is None:
+                    handle = open_log(path)
+                    if handle is None:
+                        continue
 
-                    # Update position
-                    file_positions[path] = current_size
+                # Truncated in place: restart from the beginning
+                if stat.st_size < file_positions[path]:
+                    file_positions[path] = 0
 
-                    # Process and print new lines
-                    for line in new_content.splitlines():
-                        if filter_text and filter_text.lower() not in line.lower():
-                            continue
+                # Check if file has been modified
+                if stat.st_size > file_positions[path]:
+                    # Read only the new content as raw bytes
+                    handle.seek(file_positions[path])
+                    new_content = handle.read(stat.st_size - file_positions[path])
+                    file_positions[path] += len(new_content)
 
-                        # Parse timestamp if present
-                        timestamp_match = re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)
-                        if timestamp_match:
-                            timestamp = timestamp_match.group(1)
-                            rest_of_line = line[len(timestamp) :]
-                            print(f"{color_text(timestamp, 'GREEN')} {color_text(name, 'CYAN')}{rest_of_line}")
-                        else:
-                            print(f"{color_text(name, 'CYAN')}: {line}")
+                    if new_content:
+                        has_updates = True
+                        print_new_lines(name, new_content, filter_text)
 
             # If nothing was updated, wait before checking again
             if not has_updates:
@@ -125,6 +232,9 @@ def monitor_logs(files: Dict[str, str], interval: int = 2, filter_text: Optional
 
     except KeyboardInterrupt:
         print("\nStopping log monitor.")
+    finally:
+        for handle in open_files.values():
+            handle.close()
 
 
 def main() -> None:
@@ -1,135 +1,243 @@
 """Setup wizard for Europa API key configuration."""
 
+import copy
+import functools
+import os
+import shutil
+import signal
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
-import typer
-import yaml
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.text import Text
+# rich, typer and yaml are imported on first use so importing the CLI does not pay for them
 
-console = Console()
+
+def _yaml_loader_dumper():
+    """Import yaml and return it with the fastest available safe loader and dumper."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+
+    return yaml, Loader, Dumper
+
+
+# Long keys are shown with a fixed-width mask rather than one star per hidden character
+_MASK_MAX_STARS = 12
+
+
+@functools.lru_cache(maxsize=32)
+def _mask_key(key: str) -> str:
+    """Mask an API key for display, keeping the first and last four characters."""
+    if not key or len(key) < 8:
+        return "***"
+    return key[:4] + "*" * min(len(key) - 8, _MASK_MAX_STARS) + key[-4:]
+
+
+@functools.lru_cache(maxsize=None)
+def _markup(text: str):
+    """Parse a fixed rich markup string once and reuse the highlighted Text."""
+    from rich.highlighter import ReprHighlighter
+    from rich.text import Text
+
+    # Highlight the way Console.render_str does, so output is unchanged
+    rich_text = Text.from_markup(text)
+    highlighted = ReprHighlighter()(str(rich_text))
+    highlighted.copy_styles(rich_text)
+    return highlighted
+
+
+class ExistingStatus(NamedTuple):
+    """Which API keys the existing secrets file has, along with the parsed config."""
+
+    has_gemini: bool
+    has_tavily: bool
+    config: Dict[str, Any]
+    gemini_key: Optional[str] = None
+    tavily_key: Optional[str] = None
+
+
+# Parsed secrets keyed by path, validated against (mtime, size) of the file
+_YAML_CACHE: "OrderedDict[Path, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 8
 
 
 class EuropaSetupWizard:
     """Interactive setup wizard for Europa API keys."""
 
     def __init__(self):
+        from rich.console import Console
+
         self.secrets_file = Path("fastagent.secrets.yaml")
+        # One console for the whole session, with the width measured once instead of on every render
+        self._cols = shutil.get_terminal_size((100, 24)).columns
+        self.console = Console(width=self._cols)
 
     def _load_existing_config(self) -> Dict[str, Any]:
         """Load existing secrets configuration if it exists."""
-        if not self.secrets_file.exists():
+        try:
+            st = self.secrets_file.stat()
+        except FileNotFoundError:
             return {}
 
+        path = self.secrets_file.resolve()
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(path)
+            return copy.deepcopy(cached[2])
+
         try:
+            yaml, loader, _ = _yaml_loader_dumper()
             with open(self.secrets_file, "r") as f:
-                return yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=loader) or {}
         except Exception as e:
-            console.print(f"[red]Error reading existing config: {e}[/red]")
+            self.console.print(f"[red]Error reading existing config: {e}[/red]")
             return {}
 
+        _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+        _YAML_CACHE.move_to_end(path)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+
+        return copy.deepcopy(config)
+
     def _save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to secrets file."""
+        tmp_path = None
         try:
-            with open(self.secrets_file, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+            yaml, _, dumper = _yaml_loader_dumper()
+            # Write a temp file next to the target and swap it in, so a crash never leaves a torn secrets file
+            fd, tmp_path = tempfile.mkstemp(dir=self.secrets_file.absolute().parent, prefix=".secrets.", suffix=".yaml")
+            with os.fdopen(fd, "w") as f:
+                yaml.dump(config, f, Dumper=dumper, default_flow_style=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.secrets_file)
+            tmp_path = None
             return True
         except Exception as e:
-            console.print(f"[red]Error saving configuration: {e}[/red]")
+            self.console.print(f"[red]Error saving configuration: {e}[/red]")
             return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def _mask_key(self, key: str) -> str:
         """Mask API key for display."""
-        if not key or len(key) < 8:
-            return "***"
-        return key[:4] + "*" * (len(key) - 8) + key[-4:]
+        return _mask_key(key)
 
     def show_welcome(self):
         """Display welcome message."""
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
         welcome_text = Text()
         welcome_text.append("Europa API Configuration", style="bold cyan")
 
         panel = Panel(welcome_text, subtitle="Configure your AI provider API keys", border_style="blue")
-        console.print(panel)
-        console.print()
+        self.console.print(Group(panel, ""))
 
-    def check_existing_config(self) -> Dict[str, bool]:
+    def check_existing_config(self) -> ExistingStatus:
         """Check which API keys are already configured."""
         config = self._load_existing_config()
+        gemini_key = (config.get("google") or {}).get("api_key")
+        tavily_key = config.get("TAVILY_API_KEY")
 
-        return {
-            "has_gemini": bool(config.get("google", {}).get("api_key")),
-            "has_tavily": bool(config.get("TAVILY_API_KEY")),
-            "config": config,
-        }
+        return ExistingStatus(
+            has_gemini=bool(gemini_key),
+            has_tavily=bool(tavily_key),
+            config=config,
+            gemini_key=gemini_key,
+            tavily_key=tavily_key,
+        )
 
     def prompt_for_gemini_key(self, current_key: Optional[str] = None) -> Optional[str]:
         """Prompt for Google Gemini API key."""
+        from rich.prompt import Confirm, Prompt
+
+        console = self.console
+
         if current_key:
             console.print(f"[green]Google Gemini key configured:[/green] {self._mask_key(current_key)}")
-            if not Confirm.ask("Update Google Gemini key?", default=False):
+            if not Confirm.ask("Update Google Gemini key?", default=False, console=console):
                 return current_key
 
         console.print("\n[bold cyan]Google Gemini API Key (Required)[/bold cyan]")
         console.print("[dim]Get your free key at: https://aistudio.google.com/app/apikey[/dim]")
 
         while True:
-            key = Prompt.ask("Enter your Google Gemini API key", password=True, show_default=False)
+            key = Prompt.ask("Enter your Google Gemini API key", password=True, show_default=False, console=console)
 
             if key and key.strip():
                 return key.strip()
 
             console.print("[red]Google Gemini API key is required to run Europa![/red]")
-            if not Confirm.ask("Try again?", default=True):
+            if not Confirm.ask("Try again?", default=True, console=console):
                 console.print("[yellow]Without Gemini API key, Europa will not function.[/yellow]")
                 return None
 
     def prompt_for_tavily_key(self, current_key: Optional[str] = None) -> Optional[str]:
         """Prompt for Tavily API key."""
+        from rich.prompt import Confirm, Prompt
+
+        console = self.console
+
         if current_key:
             console.print(f"[green]Tavily key configured:[/green] {self._mask_key(current_key)}")
-            if not Confirm.ask("Update Tavily key?", default=False):
+            if not Confirm.ask("Update Tavily key?", default=False, console=console):
                 return current_key
 
         console.print("\n[bold yellow]Tavily API Key (Optional - Web Search MCP)[/bold yellow]")
         console.print("[dim]Get your free key at: https://tavily.com/[/dim]")
         console.print("[dim]ℹWithout this key, web search MCP will throw 400 errors[/dim]")
 
-        if not Confirm.ask("Add Tavily API key for web search?", default=False):
+        if not Confirm.ask("Add Tavily API key for web search?", default=False, console=console):
             console.print("[yellow]Web search functionality will not be available[/yellow]")
             return None
 
-        key = Prompt.ask("Enter your Tavily API key (or press Enter to skip)", password=True, show_default=False, default="")
+        key = Prompt.ask(
+            "Enter your Tavily API key (or press Enter to skip)", password=True, show_default=False, default="", console=console
+        )
 
         return key.strip() if key and key.strip() else None
 
-    def show_update_menu(self, status: Dict[str, Any]) -> str:
+    def show_update_menu(self, status: ExistingStatus) -> str:
         """Show menu for updating existing configuration."""
-        console.print("\n[bold]Current Configuration[/bold]")
+        from rich.console import Group
+        from rich.prompt import Prompt
+        from rich.text import Text
 
-        config = status["config"]
-        gemini_key = config.get("google", {}).get("api_key")
-        tavily_key = config.get("TAVILY_API_KEY")
+        # Build the whole menu first and render it in one print
+        lines = [_markup("\n[bold]Current Configuration[/bold]")]
 
-        console.print(f"Google Gemini: {'Configured' if status['has_gemini'] else 'Not configured'}")
-        if status["has_gemini"]:
-            console.print(f"  Key: {self._mask_key(gemini_key)}")
+        lines.append(_markup("Google Gemini: Configured" if status.has_gemini else "Google Gemini: Not configured"))
+        if status.has_gemini:
+            lines.append(Text.assemble("  Key: ", self._mask_key(status.gemini_key)))
 
-        console.print(f"Tavily Search: {'Configured' if status['has_tavily'] else 'Not configured'}")
-        if status["has_tavily"]:
-            console.print(f"  Key: {self._mask_key(tavily_key)}")
+        lines.append(_markup("Tavily Search: Configured" if status.has_tavily else "Tavily Search: Not configured"))
+        if status.has_tavily:
+            lines.append(Text.assemble("  Key: ", self._mask_key(status.tavily_key)))
 
-        console.print("\n[bold]What would you like to update?[/bold]")
+        lines.append(_markup("\n[bold]What would you like to update?[/bold]"))
         choices = ["1. Update Google Gemini key", "2. Add/Update Tavily key", "3. Update both keys", "4. Exit without changes"]
 
         for choice in choices:
-            console.print(f"  {choice}")
+            lines.append(_markup(f"  {choice}"))
+
+        self.console.print(Group(*lines))
 
         while True:
-            selection = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"], default="4")
+            selection = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"], default="4", console=self.console)
             return selection
 
     def create_config(self, gemini_key: str, tavily_key: Optional[str] = None) -> Dict[str, Any]:
@@ -143,28 +251,35 @@ class EuropaSetupWizard:
 
     def show_success_message(self, gemini_configured: bool, tavily_configured: bool):
         """Show success message after configuration."""
-        console.print()
+        from rich.console import Group
+
+        console = self.console
+
+        # Build the whole message first and render it in one print
+        lines = [_markup("")]
         if gemini_configured and tavily_configured:
-            console.print("[green]Configuration completed successfully![/green]")
-            console.print("Google Gemini API key configured")
-            console.print("Tavily API key configured - Web search enabled")
+            lines.append(_markup("[green]Configuration completed successfully![/green]"))
+            lines.append(_markup("Google Gemini API key configured"))
+            lines.append(_markup("Tavily API key configured - Web search enabled"))
         elif gemini_configured:
-            console.print("[green]Configuration completed successfully![/green]")
-            console.print("Google Gemini API key configured")
-            console.print("Tavily API key not configured - Web search will return 400 errors")
+            lines.append(_markup("[green]Configuration completed successfully![/green]"))
+            lines.append(_markup("Google Gemini API key configured"))
+            lines.append(_markup("Tavily API key not configured - Web search will return 400 errors"))
         else:
-            console.print("[red]Configuration incomplete![/red]")
-            console.print("Google Gemini API key is required to run Europa!")
+            lines.append(_markup("[red]Configuration incomplete![/red]"))
+            lines.append(_markup("Google Gemini API key is required to run Europa!"))
+            console.print(Group(*lines))
             return False
 
-        console.print(f"\n[dim]Configuration saved to: {self.secrets_file.absolute()}[/dim]")
-        console.print("\n[bold cyan]Next steps:[/bold cyan]")
-        console.print("• Run '[bold]europa[/bold]' to start the AI coordinator")
-        console.print("• Enjoy the interactive terminal with F1 data and MCP integration!")
+        lines.append(f"\n[dim]Configuration saved to: {self.secrets_file.absolute()}[/dim]")
+        lines.append(_markup("\n[bold cyan]Next steps:[/bold cyan]"))
+        lines.append(_markup("• Run '[bold]europa[/bold]' to start the AI coordinator"))
+        lines.append(_markup("• Enjoy the interactive terminal with F1 data and MCP integration!"))
 
         if not tavily_configured:
-            console.print("\n[yellow]Add Tavily key later with:[/yellow] [bold]europa setup[/bold]")
+            lines.append(_markup("\n[yellow]Add Tavily key later with:[/yellow] [bold]europa setup[/bold]"))
 
+        console.print(Group(*lines))
         return True
 
     def run_initial_setup(self) -> bool:
@@ -186,21 +301,24 @@ class EuropaSetupWizard:
 
         return self.show_success_message(bool(gemini_key), bool(tavily_key))
 
-    def run_update_setup(self, status: Dict[str, Any]) -> bool:
+    def run_update_setup(self, status: ExistingStatus) -> bool:
         """Run setup to update existing configuration."""
+        console = self.console
+
         choice = self.show_update_menu(status)
 
         if choice == "4":
             console.print("[dim]No changes made.[/dim]")
             return True
 
-        config = status["config"].copy()
+        # Deep copy so nested edits below never alias the caller's (or the cache's) dicts
+        config = copy.deepcopy(status.config)
         gemini_updated = False
         tavily_updated = False
 
         # Update based on choice
         if choice in ["1", "3"]:  # Update Gemini
-            current_gemini = config.get("google", {}).get("api_key")
+            current_gemini = status.gemini_key
             new_gemini = self.prompt_for_gemini_key(current_gemini)
             if new_gemini and new_gemini != current_gemini:
                 if "google" not in config:
@@ -209,7 +327,7 @@ class EuropaSetupWizard:
                 gemini_updated = True
 
         if choice in ["2", "3"]:  # Update Tavily
-            current_tavily = config.get("TAVILY_API_KEY")
+            current_tavily = status.tavily_key
             new_tavily = self.prompt_for_tavily_key(current_tavily)
             if new_tavily != current_tavily:  # None is different from existing key
                 if new_tavily:
@@ -233,12 +351,31 @@ class EuropaSetupWizard:
 
         return True
 
+    def _on_resize(self, signum, frame):
+        """Refresh the cached terminal width after a resize."""
+        self._cols = shutil.get_terminal_size((100, 24)).columns
+        self.console.width = self._cols
+
     def run(self) -> bool:
         """Main entry point for setup wizard."""
+        console = self.console
+
+        previous_handler = None
+        if hasattr(signal, "SIGWINCH"):
+            try:
+                previous_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+            except ValueError:
+                # Signal handlers can only be installed from the main thread
+                pass
+
         try:
+            # Fresh install: nothing to read, so skip loading the config entirely
+            if not self.secrets_file.exists():
+                return self.run_initial_setup()
+
             status = self.check_existing_config()
 
-            if not status["has_gemini"] and not status["has_tavily"]:
+            if not status.has_gemini and not status.has_tavily:
                 # Fresh setup
                 return self.run_initial_setup()
             else:
@@ -251,6 +388,9 @@ class EuropaSetupWizard:
         except Exception as e:
             console.print(f"\n[red]Setup failed: {e}[/red]")
             return False
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGWINCH, previous_handler)
 
 
 def run_setup_wizard():
@@ -259,4 +399,6 @@ def run_setup_wizard():
     success = wizard.run()
 
     if not success:
+        import typer
+
         raise typer.Exit(code=1)
@@ -2,12 +2,101 @@
 
 import asyncio
 import functools
+import reprlib
 import signal
 import sys
-import traceback
+import time
+from contextlib import contextmanager
 from typing import Callable, Optional
 
-from .persistent_logger import graceful_shutdown_delay, persistent_logger
+from .persistent_logger import close_monitoring, graceful_shutdown_delay, persistent_logger
+
+# Bounded repr for logging call arguments, so a huge argument never gets fully rendered
+_repr = reprlib.Repr()
+_repr.maxstring = 120
+_repr.maxother = 120
+_repr.maxlist = _repr.maxtuple = _repr.maxdict = 4
+
+
+# Only the attributes the logs and callers use; skips copying __doc__, __dict__ and friends per decoration
+_WRAPPER_ASSIGNED = ("__name__", "__module__", "__qualname__")
+
+
+def _build_error_context(name: str, module: str, args: tuple, kwargs: dict) -> dict:
+    """Build the log context for an exception raised by a wrapped function"""
+    return {
+        "function": name,
+        "module": module,
+        "args": _repr.repr(args),
+        "kwargs": _repr.repr(kwargs),
+    }
+
+
+def _exit_on_keyboard_interrupt():
+    """Log a user requested shutdown and exit"""
+    print("\n\nKeyboardInterrupt received")
+    persistent_logger.log_info("KeyboardInterrupt received - user requested shutdown")
+    persistent_logger.log_shutdown("keyboard_interrupt", 0)
+    print("Goodbye!")
+    sys.exit(0)
+
+
+def _make_async_wrapper(f: Callable, handler: "GracefulErrorHandler", shutdown_on_error: bool, delay_seconds: int) -> Callable:
+    """Wrap a coroutine function for catch_and_log_exceptions"""
+    name, module = f.__name__, f.__module__
+    error_message = f"Unhandled exception in {name}"
+
+    @functools.wraps(f, assigned=_WRAPPER_ASSIGNED, updated=())
+    async def async_wrapper(*args, **kwargs):
+        try:
+            return await f(*args, **kwargs)
+        except KeyboardInterrupt:
+            _exit_on_keyboard_interrupt()
+        except Exception as e:
+            persistent_logger.log_error(error_message, exception=e, context=_build_error_context(name, module, args, kwargs))
+
+            if shutdown_on_error and not handler.shutdown_initiated:
+                handler.shutdown_initiated = True
+                await graceful_shutdown_delay(delay_seconds)
+                sys.exit(1)
+            else:
+                raise
+
+    return async_wrapper
+
+
+def _make_sync_wrapper(f: Callable, handler: "GracefulErrorHandler", shutdown_on_error: bool, delay_seconds: int) -> Callable:
+    """Wrap a regular function for catch_and_log_exceptions"""
+    name, module = f.__name__, f.__module__
+    error_message = f"Unhandled exception in {name}"
+
+    @functools.wraps(f, assigned=_WRAPPER_ASSIGNED, updated=())
+    def sync_wrapper(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except KeyboardInterrupt:
+            _exit_on_keyboard_interrupt()
+        except Exception as e:
+            persistent_logger.log_error(error_message, exception=e, context=_build_error_context(name, module, args, kwargs))
+
+            if shutdown_on_error and not handler.shutdown_initiated:
+                handler.shutdown_initiated = True
+
+                print(f"\n{'=' * 60}")
+                print("ERROR DETECTED - Logs saved to logs/ directory")
+                print("Recent errors:")
+                print(persistent_logger.create_error_summary())
+                print(f"{'=' * 60}")
+                print(f"Shutting down in {delay_seconds} seconds...", flush=True)
+                time.sleep(delay_seconds)
+
+                print("Shutdown complete.")
+                persistent_logger.log_shutdown("error", 1)
+                sys.exit(1)
+            else:
+                raise
+
+    return sync_wrapper
 
 
 class GracefulErrorHandler:
@@ -21,17 +110,56 @@ class GracefulErrorHandler:
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
+        """Setup signal handlers for graceful shutdown
 
-        def signal_handler(signum, frame):
-            if not self.shutdown_initiated:
-                self.shutdown_initiated = True
-                print(f"\nReceived signal {signum}")
-                persistent_logger.log_warning(f"Received signal {signum}", {"signal": signum})
-                asyncio.create_task(self._graceful_signal_shutdown(signum))
+        Inside a running event loop the handlers are registered with
+        loop.add_signal_handler. Otherwise a plain handler is installed that
+        only schedules the async shutdown if a loop is running when the
+        signal arrives, and exits directly when there is none.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            if loop is not None:
+                try:
+                    loop.add_signal_handler(signum, self._handle_loop_signal, signum)
+                    continue
+                except (NotImplementedError, RuntimeError):
+                    # Not supported on this platform or outside the main thread
+                    pass
+            try:
+                signal.signal(signum, self._handle_sync_signal)
+            except ValueError:
+                # Signal handlers can only be installed from the main thread
+                pass
+
+    def _begin_signal_shutdown(self, signum: int) -> bool:
+        """Record the first shutdown signal, returns False if one was already received"""
+        if self.shutdown_initiated:
+            return False
+        self.shutdown_initiated = True
+        print(f"\nReceived signal {signum}")
+        persistent_logger.log_warning(f"Received signal {signum}", {"signal": signum})
+        return True
+
+    def _handle_loop_signal(self, signum: int):
+        if self._begin_signal_shutdown(signum):
+            asyncio.ensure_future(self._graceful_signal_shutdown(signum))
+
+    def _handle_sync_signal(self, signum, frame):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to run the graceful shutdown on: exit now, and let a repeated signal cut any delay short
+            if self._begin_signal_shutdown(signum):
+                persistent_logger.log_shutdown(f"signal_{signum}", signum)
+            sys.exit(signum)
 
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        if self._begin_signal_shutdown(signum):
+            asyncio.create_task(self._graceful_signal_shutdown(signum))
 
     async def _graceful_signal_shutdown(self, signum: int):
         """Handle graceful shutdown from signals"""
@@ -39,6 +167,7 @@ class GracefulErrorHandler:
             persistent_logger.log_shutdown(f"signal_{signum}", signum)
             await graceful_shutdown_delay(2)
         finally:
+            await close_monitoring()
             sys.exit(signum)
 
     def catch_and_log_exceptions(self, func: Optional[Callable] = None, *, shutdown_on_error: bool = True, delay_seconds: int = 3):
@@ -53,79 +182,8 @@ class GracefulErrorHandler:
 
         def decorator(f: Callable) -> Callable:
             if asyncio.iscoroutinefunction(f):
-
-                @functools.wraps(f)
-                async def async_wrapper(*args, **kwargs):
-                    try:
-                        return await f(*args, **kwargs)
-                    except KeyboardInterrupt:
-                        print("\n\nKeyboardInterrupt received")
-                        persistent_logger.log_info("KeyboardInterrupt received - user requested shutdown")
-                        persistent_logger.log_shutdown("keyboard_interrupt", 0)
-                        print("Goodbye!")
-                        sys.exit(0)
-                    except Exception as e:
-                        error_context = {
-                            "function": f.__name__,
-                            "module": f.__module__,
-                            "args": str(args)[:200],  # Limit args logging
-                            "kwargs": str(kwargs)[:200],
-                        }
-
-                        persistent_logger.log_error(f"Unhandled exception in {f.__name__}", exception=e, context=error_context)
-
-                        if shutdown_on_error and not self.shutdown_initiated:
-                            self.shutdown_initiated = True
-                            await graceful_shutdown_delay(delay_seconds)
-                            sys.exit(1)
-                        else:
-                            raise
-
-                return async_wrapper
-            else:
-
-                @functools.wraps(f)
-                def sync_wrapper(*args, **kwargs):
-                    try:
-                        return f(*args, **kwargs)
-                    except KeyboardInterrupt:
-                        print("\n\nKeyboardInterrupt received")
-                        persistent_logger.log_info("KeyboardInterrupt received - user requested shutdown")
-                        persistent_logger.log_shutdown("keyboard_interrupt", 0)
-                        print("Goodbye!")
-                        sys.exit(0)
-                    except Exception as e:
-                        error_context = {
-                            "function": f.__name__,
-                            "module": f.__module__,
-                            "args": str(args)[:200],
-                            "kwargs": str(kwargs)[:200],
-                        }
-
-                        persistent_logger.log_error(f"Unhandled exception in {f.__name__}", exception=e, context=error_context)
-
-                        if shutdown_on_error and not self.shutdown_initiated:
-                            self.shutdown_initiated = True
-                            import time
-
-                            print(f"\n{'=' * 60}")
-                            print("ERROR DETECTED - Logs saved to logs/ directory")
-                            print("Recent errors:")
-                            print(persistent_logger.create_error_summary())
-                            print(f"{'=' * 60}")
-                            print(f"Shutting down in {delay_seconds} seconds...")
-
-                            for i in range(delay_seconds, 0, -1):
-                                print(f"  {i}...", end=" ", flush=True)
-                                time.sleep(1)
-
-                            print("\nShutdown complete.")
-                            persistent_logger.log_shutdown("error", 1)
-                            sys.exit(1)
-                        else:
-                            raise
-
-                return sync_wrapper
+                return _make_async_wrapper(f, self, shutdown_on_error, delay_seconds)
+            return _make_sync_wrapper(f, self, shutdown_on_error, delay_seconds)
 
         if func is None:
             return decorator
@@ -146,32 +204,24 @@ class GracefulErrorHandler:
             persistent_logger.log_error(f"Task '{task_name}' failed", exception=e, context={"task": task_name})
             raise
 
-    def log_and_reraise(self, message: str, context: Optional[dict] = None):
-        """
-        Context manager to log exceptions and re-raise them
 
-        Usage:
-            with error_handler.log_and_reraise("MCP connection failed"):
-                # code that might fail
-        """
-        return _LogAndReraiseContext(message, context)
-
-
-class _LogAndReraiseContext:
-    """Context manager for logging and re-raising exceptions"""
-
-    def __init__(self, message: str, context: Optional[dict] = None):
-        self.message = message
-        self.context = context or {}
+@contextmanager
+def log_and_reraise(message: str, context: Optional[dict] = None):
+    """
+    Context manager to log exceptions and re-raise them
 
-    def __enter__(self):
-        return self
+    Usage:
+        with error_handler.log_and_reraise("MCP connection failed"):
+            # code that might fail
+    """
+    try:
+        yield
+    except BaseException as e:
+        persistent_logger.log_error(message, exception=e, context=context or {})
+        raise
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
-            persistent_logger.log_error(self.message, exception=exc_val, context=self.context)
-        return False
 
+GracefulErrorHandler.log_and_reraise = staticmethod(log_and_reraise)
 
 error_handler = GracefulErrorHandler()
 
@@ -194,26 +244,31 @@ def safe_async_task(task_name: str):
     return decorator
 
 
-def setup_global_exception_handler():
-    """Setup global exception handler for uncaught exceptions"""
+def _handle_uncaught_exception(exc_type, exc_value, exc_traceback):
+    """sys.excepthook that logs uncaught exceptions and exits"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        persistent_logger.log_info("KeyboardInterrupt - user requested shutdown")
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
 
-    def handle_exception(exc_type, exc_value, exc_traceback):
-        if issubclass(exc_type, KeyboardInterrupt):
-            persistent_logger.log_info("KeyboardInterrupt - user requested shutdown")
-            sys.__excepthook__(exc_type, exc_value, exc_traceback)
-            return
+    import traceback
 
-        persistent_logger.log_error(
-            "Uncaught exception",
-            exception=exc_value,
-            context={"type": exc_type.__name__, "traceback": "".join(traceback.format_tb(exc_traceback))},
-        )
+    persistent_logger.log_error(
+        "Uncaught exception",
+        exception=exc_value,
+        context={"type": exc_type.__name__, "traceback": "".join(traceback.format_tb(exc_traceback))},
+    )
 
-        print(f"\n{'=' * 60}")
-        print("FATAL ERROR - Check logs/europa_errors.log for details")
-        print(f"{'=' * 60}")
+    print(f"\n{'=' * 60}")
+    print("FATAL ERROR - Check logs/europa_errors.log for details")
+    print(f"{'=' * 60}")
 
-        persistent_logger.log_shutdown("uncaught_exception", 1)
-        sys.exit(1)
+    persistent_logger.log_shutdown("uncaught_exception", 1)
+    sys.exit(1)
 
-    sys.excepthook = handle_exception
+
+def setup_global_exception_handler():
+    """Setup global exception handler for uncaught exceptions, once per process"""
+    if sys.excepthook is _handle_uncaught_exception:
+        return
+    sys.excepthook = _handle_uncaught_exception
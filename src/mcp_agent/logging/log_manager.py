@@ -1,10 +1,200 @@
 #!/usr/bin/env python3
 
+import asyncio
+import fnmatch
+import gzip
 import json
+import os
+import re
 import shutil
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Read size for scanning JSONL files
+JSONL_CHUNK_SIZE = 256 * 1024
+
+# Copy buffer and level for compressing old logs, repetitive log text compresses well even at level 1
+GZIP_BUFFER_SIZE = 256 * 1024
+GZIP_COMPRESS_LEVEL = 1
+COMPRESS_MAX_WORKERS = 4
+
+# Seconds a directory size or analysis result is reused for
+ANALYSIS_CACHE_TTL = 5.0
+
+# Error messages mentioning any of these are reported as critical
+CRITICAL_ERROR_RE = re.compile(r"fatal|critical|crash|abort", re.IGNORECASE)
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO timestamp, only rewriting a trailing Z when there is one"""
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
+
+
+def _record_ts(record: Dict[str, Any]) -> float:
+    """Epoch seconds of a JSONL record, parsing the timestamp only for records written without a ts field"""
+    ts = record.get("ts")
+    if ts is None:
+        ts = _parse_timestamp(record["timestamp"]).timestamp()
+    return ts
+
+
+# persistent_logger writes ts directly after timestamp, with or without spaces depending on the serializer
+_LEADING_TS_RE = re.compile(rb'^\{"timestamp":\s*"[^"]*",\s*"ts":\s*([0-9.eE+-]+)')
+
+
+def _is_older(line: bytes, min_ts: float) -> bool:
+    """Whether a raw JSONL line carries a leading ts field older than min_ts"""
+    match = _LEADING_TS_RE.match(line)
+    return match is not None and float(match.group(1)) < min_ts
+
+
+def _iter_jsonl(path: Path, start: int = 0, min_ts: Optional[float] = None) -> Iterator[Tuple[int, Optional[int], Any]]:
+    """
+    Yield (byte offset, next offset, record) from a JSONL file, skipping empty and malformed lines
+
+    The next offset is where the line after the record's newline starts, or None
+    for a final line with no newline yet, which may still be mid-write.
+
+    Reading begins at byte offset `start`. With orjson the file is read in large
+    binary chunks into one reusable buffer and split on newlines with
+    bytearray.find, so lines go straight from bytes to orjson. Without orjson,
+    records whose leading ts field is older than `min_ts` are skipped without
+    being parsed; orjson parses them faster than that check can reject them, so
+    callers still filter on ts themselves.
+    """
+    if not ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                line_offset = offset
+                offset += len(line)
+                if min_ts is not None and _is_older(line, min_ts):
+                    continue
+                try:
+                    yield line_offset, offset if line.endswith(b"\n") else None, json.loads(line.decode("utf-8"))
+                except ValueError:
+                    continue
+        return
+
+    chunk = bytearray(JSONL_CHUNK_SIZE)
+    view = memoryview(chunk)
+    pending = bytearray()
+    base = start  # file offset of pending[0]
+
+    with open(path, "rb", buffering=0) as f:
+        f.seek(start)
+        while True:
+            read = f.readinto(chunk)
+            if not read:
+                break
+            pending += view[:read]
+
+            line_start = 0
+            while (end := pending.find(b"\n", line_start)) != -1:
+                if end > line_start:
+                    try:
+                        yield base + line_start, base + end + 1, orjson.loads(pending[line_start:end])
+                    except orjson.JSONDecodeError:
+                        pass
+                line_start = end + 1
+            del pending[:line_start]
+            base += line_start
+
+    if pending:
+        try:
+            yield base, None, orjson.loads(pending)
+        except orjson.JSONDecodeError:
+            pass
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Identity and change markers of a file, or None when it does not exist"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _snapshot_logs(directory: Path, pattern: str) -> List[Tuple[Path, str, float, int]]:
+    """(path, name, mtime, size) of the files in directory matching pattern, from one scandir pass"""
+    snapshot = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatchcase(entry.name, pattern):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot.append((Path(entry.path), entry.name, entry_stat.st_mtime, entry_stat.st_size))
+    except OSError:
+        pass
+    return snapshot
+
+
+def _session_day_start(name: str) -> Optional[float]:
+    """Epoch time of local midnight on the day a session_YYYYMMDD_HHMMSS log was started, None for other names"""
+    if not name.startswith("session_"):
+        return None
+    try:
+        return datetime.strptime(name[8:16], "%Y%m%d").timestamp()
+    except ValueError:
+        return None
+
+
+def _stale_logs(directory: Path, pattern: str, cutoff_ts: float) -> List[Path]:
+    """
+    Files in directory matching pattern that were last modified before cutoff_ts
+
+    A session log is written from the time in its name onwards, so one dated on
+    or after the cutoff day cannot be stale and is skipped without a stat call.
+    """
+    stale = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatchcase(entry.name, pattern):
+                    continue
+                day_start = _session_day_start(entry.name)
+                if day_start is not None and day_start >= cutoff_ts:
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                        stale.append(Path(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return stale
+
+
+def _gzip_one(log_file: Path):
+    """Compress a single log file next to itself and remove the original"""
+    compressed_file = log_file.with_suffix(".log.gz")
+
+    with open(log_file, "rb", buffering=GZIP_BUFFER_SIZE) as f_in:
+        with gzip.open(compressed_file, "wb", compresslevel=GZIP_COMPRESS_LEVEL) as f_out:
+            shutil.copyfileobj(f_in, f_out, GZIP_BUFFER_SIZE)
+
+    log_file.unlink()
 
 
 class LogManager:
@@ -15,6 +205,65 @@ class LogManager:
     def __init__(self, logs_dir: Path = Path("logs")):
         self.logs_dir = logs_dir
         self.logs_dir.mkdir(exist_ok=True)
+        self.errors_index_file = self.logs_dir / "errors.jsonl.idx"
+        self._errors_index = self._load_errors_index()
+        self.sessions_index_file = self.logs_dir / "sessions.jsonl.idx"
+        self._sessions_index = self._load_sessions_index()
+        # key -> (expiry, file signature, result)
+        self._analysis_cache: Dict[tuple, Tuple[float, Any, Any]] = {}
+
+    def _cached(self, key: tuple, compute: Callable[[], Any], signature: Any = None) -> Any:
+        """
+        Return the result for key computed within the last ANALYSIS_CACHE_TTL seconds,
+        as long as the signature of the underlying file has not changed since
+        """
+        now = time.monotonic()
+        entry = self._analysis_cache.get(key)
+        if entry is not None and entry[0] > now and entry[1] == signature:
+            return entry[2]
+
+        result = compute()
+        self._analysis_cache[key] = (now + ANALYSIS_CACHE_TTL, signature, result)
+        return result
+
+    def _invalidate_cache(self):
+        """Drop cached sizes and analyses after files were moved, compressed or deleted"""
+        self._analysis_cache.clear()
+
+    def _load_errors_index(self) -> Optional[Dict[str, Any]]:
+        """Load the errors.jsonl offset index, if there is a usable one"""
+        try:
+            index = json.loads(self.errors_index_file.read_text(encoding="utf-8"))
+            if {"offset", "cutoff", "inode"} <= index.keys():
+                return index
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+
+    def _errors_scan_start(self, errors_stat, cutoff_ts: float) -> int:
+        """
+        Byte offset in errors.jsonl to start an analysis from
+
+        The index holds the offset of the first record at or after the cutoff of
+        an earlier scan. Everything before it is older than that cutoff, so it can
+        be skipped whenever the new cutoff is not earlier. A different inode or a
+        file shorter than the offset means errors.jsonl was replaced.
+        """
+        index = self._errors_index
+        if index is None or index["inode"] != errors_stat.st_ino or index["offset"] > errors_stat.st_size or cutoff_ts < index["cutoff"]:
+            return 0
+        return index["offset"]
+
+    def _save_errors_index(self, offset: int, cutoff_ts: float, inode: int, first_ts: Optional[str]):
+        """Persist the errors.jsonl offset index, best effort"""
+        index = {"offset": offset, "cutoff": cutoff_ts, "inode": inode, "first_ts": first_ts}
+        if index == self._errors_index:
+            return
+        self._errors_index = index
+        try:
+            self.errors_index_file.write_text(json.dumps(index), encoding="utf-8")
+        except OSError:
+            pass
 
     def rotate_logs(self, max_age_days: int = 7, max_size_mb: int = 100):
         """
@@ -28,10 +277,9 @@ class LogManager:
 
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
 
-        session_logs = list(self.logs_dir.glob("session_*.log"))
         archived_count = 0
 
-        for log_file in session_logs:
+        for log_file, _, _, _ in _snapshot_logs(self.logs_dir, "session_*.log"):
             try:
                 filename = log_file.stem
                 date_str = filename.split("_", 1)[1].split("_")[0]
@@ -50,6 +298,7 @@ class LogManager:
 
         if archived_count > 0:
             print(f"Archived {archived_count} old session logs")
+            self._invalidate_cache()
 
         total_size_mb = self._calculate_directory_size() / (1024 * 1024)
         if total_size_mb > max_size_mb:
@@ -57,33 +306,50 @@ class LogManager:
 
     def _calculate_directory_size(self) -> int:
         """Calculate total size of logs directory in bytes"""
+        return self._cached(("directory_size",), self._walk_directory_size)
+
+    def _walk_directory_size(self) -> int:
+        """Sum the sizes of all files under the logs directory"""
         total_size = 0
-        for file_path in self.logs_dir.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        stack = [self.logs_dir]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
         return total_size
 
     def _compress_old_logs(self):
         """Compress old log files to save space"""
-        import gzip
-
         cutoff = datetime.now() - timedelta(days=1)
-
-        for log_file in self.logs_dir.glob("*.log"):
-            if log_file.stat().st_mtime < cutoff.timestamp():
+        cutoff_ts = cutoff.timestamp()
+        old_logs = [log_file for log_file, _, mtime, _ in _snapshot_logs(self.logs_dir, "*.log") if mtime < cutoff_ts]
+        if not old_logs:
+            return
+
+        # zlib releases the GIL, so files compress in parallel
+        with ThreadPoolExecutor(max_workers=min(COMPRESS_MAX_WORKERS, len(old_logs), os.cpu_count() or 1)) as executor:
+            futures = {executor.submit(_gzip_one, log_file): log_file for log_file in old_logs}
+            for future in as_completed(futures):
+                log_file = futures[future]
                 try:
-                    compressed_file = log_file.with_suffix(".log.gz")
-
-                    with open(log_file, "rb") as f_in:
-                        with gzip.open(compressed_file, "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-
-                    log_file.unlink()
+                    future.result()
                     print(f"Compressed {log_file.name}")
-
                 except Exception as e:
                     print(f"Failed to compress {log_file.name}: {e}")
 
+        self._invalidate_cache()
+
+    async def compress_old_logs_async(self):
+        """Compress old log files without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._compress_old_logs)
+
     def analyze_errors(self, days: int = 7) -> Dict:
         """
         Analyze error patterns from the last N days
@@ -91,6 +357,11 @@ class LogManager:
         Returns:
             Dictionary with error analysis
         """
+        json_errors_file = self.logs_dir / "errors.jsonl"
+        return self._cached(("analyze_errors", days), lambda: self._analyze_errors(days), _file_signature(json_errors_file))
+
+    def _analyze_errors(self, days: int) -> Dict:
+        """Scan errors.jsonl for analyze_errors"""
         analysis = {"total_errors": 0, "error_types": {}, "error_timeline": [], "top_error_sources": {}, "critical_errors": []}
 
         json_errors_file = self.logs_dir / "errors.jsonl"
@@ -100,45 +371,54 @@ class LogManager:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
         try:
-            with open(json_errors_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        error_data = json.loads(line.strip())
-                        error_time = datetime.fromisoformat(error_data["timestamp"].replace("Z", "+00:00"))
+            errors_stat = json_errors_file.stat()
+            cutoff_ts = cutoff_date.timestamp()
+            first_offset = None
+            first_ts = None
+            # Error types and source functions are gathered as columns and tallied once after the scan
+            error_types = []
+            error_sources = []
+            timeline = analysis["error_timeline"]
+            critical_errors = analysis["critical_errors"]
+
+            try:
+                for offset, _, error_data in _iter_jsonl(json_errors_file, self._errors_scan_start(errors_stat, cutoff_ts), cutoff_ts):
+                    if _record_ts(error_data) < cutoff_ts:
+                        continue
 
-                        if error_time < cutoff_date:
-                            continue
+                    if first_offset is None:
+                        first_offset, first_ts = offset, error_data["timestamp"]
 
-                        analysis["total_errors"] += 1
+                    analysis["total_errors"] += 1
 
-                        if "exception" in error_data:
-                            error_type = error_data["exception"]["type"]
-                            analysis["error_types"][error_type] = analysis["error_types"].get(error_type, 0) + 1
+                    if "exception" in error_data:
+                        error_types.append(error_data["exception"]["type"])
 
-                        analysis["error_timeline"].append(
+                    message = error_data["message"]
+                    timeline.append(
+                        {"timestamp": error_data["timestamp"], "message": message[:100] + "..." if len(message) > 100 else message}
+                    )
+
+                    if "context" in error_data and "function" in error_data["context"]:
+                        error_sources.append(error_data["context"]["function"])
+
+                    if CRITICAL_ERROR_RE.search(message):
+                        critical_errors.append(
                             {
                                 "timestamp": error_data["timestamp"],
-                                "message": error_data["message"][:100] + "..."
-                                if len(error_data["message"]) > 100
-                                else error_data["message"],
+                                "message": message,
+                                "type": error_data.get("exception", {}).get("type", "Unknown"),
                             }
                         )
+            finally:
+                # Counter keeps first-seen order, like the per-record dict updates it replaces
+                analysis["error_types"] = dict(Counter(error_types))
+                analysis["top_error_sources"] = dict(Counter(error_sources))
 
-                        if "context" in error_data and "function" in error_data["context"]:
-                            func_name = error_data["context"]["function"]
-                            analysis["top_error_sources"][func_name] = analysis["top_error_sources"].get(func_name, 0) + 1
-
-                        if any(keyword in error_data["message"].lower() for keyword in ["fatal", "critical", "crash", "abort"]):
-                            analysis["critical_errors"].append(
-                                {
-                                    "timestamp": error_data["timestamp"],
-                                    "message": error_data["message"],
-                                    "type": error_data.get("exception", {}).get("type", "Unknown"),
-                                }
-                            )
-
-                    except json.JSONDecodeError:
-                        continue
+            # Nothing inside the window yet: everything up to the scanned size is old
+            if first_offset is None:
+                first_offset = errors_stat.st_size
+            self._save_errors_index(first_offset, cutoff_ts, errors_stat.st_ino, first_ts)
 
         except Exception as e:
             print(f"Error analyzing errors: {e}")
@@ -182,71 +462,138 @@ class LogManager:
         """Get information about all log files"""
         log_files = []
 
-        for log_file in self.logs_dir.glob("*.log"):
-            try:
-                stat = log_file.stat()
-                log_files.append(
-                    {
-                        "name": log_file.name,
-                        "size_mb": stat.st_size / (1024 * 1024),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "path": str(log_file),
-                    }
-                )
-            except Exception as e:
-                print(f"Error reading {log_file}: {e}")
+        with os.scandir(self.logs_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".log"):
+                    continue
+                try:
+                    stat = entry.stat()
+                    log_files.append(
+                        {
+                            "name": entry.name,
+                            "size_mb": stat.st_size / (1024 * 1024),
+                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                            "path": entry.path,
+                        }
+                    )
+                except Exception as e:
+                    print(f"Error reading {entry.path}: {e}")
 
         return sorted(log_files, key=lambda x: x["modified"], reverse=True)
 
     def get_session_summary(self) -> Dict:
         """Get summary of session information"""
         sessions_file = self.logs_dir / "sessions.jsonl"
+        return self._cached(("session_summary",), self._summarize_sessions, _file_signature(sessions_file))
+
+    def _load_sessions_index(self) -> Optional[Dict[str, Any]]:
+        """Load the running sessions.jsonl summary, if there is a usable one"""
+        try:
+            index = json.loads(self.sessions_index_file.read_text(encoding="utf-8"))
+            if {"offset", "inode", "today_start", "total_sessions", "today_count"} <= index.keys():
+                return index
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+
+    def _save_sessions_index(self, index: Dict[str, Any]):
+        """Persist the running sessions.jsonl summary, best effort"""
+        if index == self._sessions_index:
+            return
+        self._sessions_index = index
+        try:
+            self.sessions_index_file.write_text(json.dumps(index), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _summarize_sessions(self) -> Dict:
+        """
+        Update the running sessions.jsonl summary for get_session_summary
+
+        The summary persisted in sessions.jsonl.idx covers the file up to its
+        offset, so only sessions appended since are read. It is rebuilt from the
+        start when sessions.jsonl was replaced or truncated, and when the day
+        changed, since today_count then has to be counted again.
+        """
+        sessions_file = self.logs_dir / "sessions.jsonl"
 
         summary = {"total_sessions": 0, "today_count": 0, "last_session": None, "average_duration": None}
 
         if not sessions_file.exists():
             return summary
 
-        today = datetime.now().date()
-        durations = []
+        # Session timestamps are UTC, so today's sessions are those within today's date in UTC
+        today_start_ts = datetime.combine(datetime.now().date(), datetime.min.time(), tzinfo=timezone.utc).timestamp()
+        today_end_ts = today_start_ts + 24 * 60 * 60
+
+        index = self._sessions_index
+        try:
+            sessions_stat = sessions_file.stat()
+        except OSError as e:
+            print(f"Error reading sessions: {e}")
+            return summary
+
+        if (
+            index is None
+            or index["inode"] != sessions_stat.st_ino
+            or index["offset"] > sessions_stat.st_size
+            or index["today_start"] != today_start_ts
+        ):
+            index = {
+                "offset": 0,
+                "inode": sessions_stat.st_ino,
+                "today_start": today_start_ts,
+                "total_sessions": 0,
+                "today_count": 0,
+                "last_ts": None,
+                "last_session": None,
+                "duration_total": 0.0,
+                "duration_count": 0,
+            }
+        else:
+            index = dict(index)
 
         try:
-            with open(sessions_file, "r", encoding="utf-8") as f:
-                for line in f:
+            # Stop at the size seen above, the next call picks up anything appended meanwhile.
+            # A record is only counted once its newline is in, so a half-written line is read again later
+            for _, next_offset, session_data in _iter_jsonl(sessions_file, index["offset"]):
+                if next_offset is None or next_offset > sessions_stat.st_size:
+                    break
+                index["offset"] = next_offset
+
+                index["total_sessions"] += 1
+
+                session_ts = _record_ts(session_data)
+                if today_start_ts <= session_ts < today_end_ts:
+                    index["today_count"] += 1
+
+                if index["last_ts"] is None or session_ts > index["last_ts"]:
+                    index["last_ts"] = session_ts
+                    index["last_session"] = session_data["timestamp"]
+
+                if "session_duration" in session_data:
+                    duration_str = session_data["session_duration"]
                     try:
-                        session_data = json.loads(line.strip())
-                        summary["total_sessions"] += 1
-
-                        session_time = datetime.fromisoformat(session_data["timestamp"].replace("Z", "+00:00"))
-                        if session_time.date() == today:
-                            summary["today_count"] += 1
-
-                        if not summary["last_session"] or session_time > datetime.fromisoformat(
-                            summary["last_session"].replace("Z", "+00:00")
-                        ):
-                            summary["last_session"] = session_data["timestamp"]
-
-                        if "session_duration" in session_data:
-                            duration_str = session_data["session_duration"]
-                            try:
-                                time_parts = duration_str.split(":")
-                                if len(time_parts) >= 3:
-                                    hours = int(time_parts[0])
-                                    minutes = int(time_parts[1])
-                                    seconds = float(time_parts[2])
-                                    total_seconds = hours * 3600 + minutes * 60 + seconds
-                                    durations.append(total_seconds)
-                            except ValueError:
-                                pass
-
-                    except json.JSONDecodeError:
-                        continue
+                        time_parts = duration_str.split(":")
+                        if len(time_parts) >= 3:
+                            hours = int(time_parts[0])
+                            minutes = int(time_parts[1])
+                            seconds = float(time_parts[2])
+                            index["duration_total"] += hours * 3600 + minutes * 60 + seconds
+                            index["duration_count"] += 1
+                    except ValueError:
+                        pass
+
+            self._save_sessions_index(index)
 
         except Exception as e:
             print(f"Error reading sessions: {e}")
 
-        if durations:
-            avg_seconds = sum(durations) / len(durations)
+        summary["total_sessions"] = index["total_sessions"]
+        summary["today_count"] = index["today_count"]
+        summary["last_session"] = index["last_session"]
+        if index["duration_count"]:
+            avg_seconds = index["duration_total"] / index["duration_count"]
             summary["average_duration"] = f"{avg_seconds:.1f}s"
 
         return summary
@@ -258,29 +605,26 @@ class LogManager:
         Args:
             keep_days: Number of days to keep logs
         """
-        cutoff_date = datetime.now() - timedelta(days=keep_days)
+        cutoff_ts = (datetime.now() - timedelta(days=keep_days)).timestamp()
         deleted_count = 0
 
-        for log_file in self.logs_dir.glob("session_*.log"):
+        for log_file in _stale_logs(self.logs_dir, "session_*.log", cutoff_ts):
             try:
-                if log_file.stat().st_mtime < cutoff_date.timestamp():
-                    log_file.unlink()
-                    deleted_count += 1
+                log_file.unlink()
+                deleted_count += 1
             except Exception as e:
                 print(f"Error deleting {log_file}: {e}")
 
-        archived_dir = self.logs_dir / "archived"
-        if archived_dir.exists():
-            for log_file in archived_dir.glob("*"):
-                try:
-                    if log_file.stat().st_mtime < cutoff_date.timestamp():
-                        log_file.unlink()
-                        deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting archived {log_file}: {e}")
+        for log_file in _stale_logs(self.logs_dir / "archived", "*", cutoff_ts):
+            try:
+                log_file.unlink()
+                deleted_count += 1
+            except Exception as e:
+                print(f"Error deleting archived {log_file}: {e}")
 
         if deleted_count > 0:
             print(f"Cleaned up {deleted_count} old log files")
+            self._invalidate_cache()
 
     def export_error_report(self, output_file: Path, days: int = 7) -> bool:
         """
@@ -307,8 +651,20 @@ class LogManager:
                 "detailed_analysis": analysis,
             }
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(report_data, option=orjson.OPT_INDENT_2, default=str)
+            else:
+                payload = json.dumps(report_data, indent=2, default=str).encode("utf-8")
+
+            # Write next to the target and rename over it, so readers never see a partial report
+            output_file = Path(output_file)
+            tmp_file = output_file.with_name(output_file.name + ".tmp")
+            try:
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, output_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
 
             print(f"Error report exported to {output_file}")
             return True
@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 
 import asyncio
+import atexit
 import json
 import logging
 import os
+import queue
+import reprlib
+import threading
+import time
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from ..monitoring import error_tracker, metrics_collector
@@ -16,6 +28,128 @@ try:
 except ImportError:
     MONITORING_AVAILABLE = False
 
+# errors.jsonl is rolled over to errors.jsonl.1 once it grows past this
+JSON_ERRORS_MAX_BYTES = 5 * 1024 * 1024
+
+# The errors.jsonl writer thread gathers up to this many records, waiting at most this long, per write
+JSON_ERRORS_BATCH_MAX = 256
+JSON_ERRORS_BATCH_WINDOW = 0.05
+# Minimum seconds between data syncs of errors.jsonl
+JSON_ERRORS_SYNC_INTERVAL = 1.0
+
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Errors waiting for the monitoring tracker, and how many it takes per batch
+TRACK_QUEUE_MAX = 4096
+TRACK_BATCH_MAX = 64
+
+# Environment variables logged at startup, each cut to at most this many characters
+STARTUP_ENV_KEYS = ("PATH", "HOME", "USER", "SHELL", "TERM", "PYTHONPATH", "VIRTUAL_ENV")
+STARTUP_ENV_MAX_CHARS = 200
+
+# Lines shown by create_error_summary, and the block size europa_errors.log is read back in
+ERROR_SUMMARY_LINES = 20
+TAIL_CHUNK_SIZE = 32 * 1024
+
+
+# Exception args are stored as-is only when they are JSON primitives of bounded size, otherwise as a bounded repr
+EXCEPTION_ARG_MAX_CHARS = 1000
+# Longer exception messages are cut, the full text still goes to the text logs with the traceback
+EXCEPTION_MESSAGE_MAX_CHARS = 4000
+_args_repr = reprlib.Repr()
+_args_repr.maxstring = 200
+_args_repr.maxother = 200
+_args_repr.maxlist = _args_repr.maxtuple = _args_repr.maxdict = 10
+
+
+def _is_plain_arg(value: Any) -> bool:
+    """Whether an exception argument serializes to a small JSON value with both json and orjson"""
+    if value is None or isinstance(value, (bool, float)):
+        return True
+    if isinstance(value, int):
+        # orjson only takes 64-bit integers
+        return -(2**63) <= value < 2**64
+    return isinstance(value, str) and len(value) <= EXCEPTION_ARG_MAX_CHARS
+
+
+def _exception_record(exception: BaseException) -> Dict[str, Any]:
+    """The exception entry of an error record"""
+    try:
+        message = str(exception)
+    except Exception:
+        message = f"<unprintable {type(exception).__name__}>"
+    if len(message) > EXCEPTION_MESSAGE_MAX_CHARS:
+        message = message[:EXCEPTION_MESSAGE_MAX_CHARS] + "..."
+    record = {"type": type(exception).__name__, "message": message}
+    args = exception.args
+    if all(_is_plain_arg(arg) for arg in args):
+        record["args"] = args
+    else:
+        record["args_repr"] = _args_repr.repr(args)
+    return record
+
+
+def _dumps_jsonl(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as one JSONL line, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def _tail_lines(path: Path, n: int) -> List[str]:
+    """Last n lines of a text file, reading blocks backwards from its end"""
+    chunks = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # One more newline than lines wanted, so the first kept line is complete
+        while pos > 0 and newlines <= n:
+            step = min(TAIL_CHUNK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+    tail = b"".join(reversed(chunks))
+    return [line.decode("utf-8", errors="replace") for line in tail.splitlines(keepends=True)[-n:]]
+
+
+_UTC = timezone.utc
+# (epoch second, formatted date and time) of the last timestamp built
+_timestamp_cache = (None, "")
+
+
+def _utc_timestamp(now_ns: Optional[int] = None) -> str:
+    """UTC time formatted like datetime.now(timezone.utc).isoformat(), formatting the date part once per second"""
+    global _timestamp_cache
+    if now_ns is None:
+        now_ns = time.time_ns()
+    second, micros = divmod(now_ns // 1000, 1_000_000)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, _UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}+00:00" if micros else prefix + "+00:00"
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter that formats the record time once per second instead of once per record"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ((epoch second, date format), formatted time) of the last record formatted
+        self._time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        key = (int(record.created), datefmt)
+        cached_key, formatted = self._time_cache
+        if key != cached_key:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(key[0]))
+            self._time_cache = (key, formatted)
+        if not datefmt and self.default_msec_format:
+            return self.default_msec_format % (formatted, record.msecs)
+        return formatted
+
 
 class PersistentLogger:
     """
@@ -41,6 +175,23 @@ class PersistentLogger:
         self.logs_dir = Path("logs")
         self.logs_dir.mkdir(exist_ok=True)
 
+        # errors.jsonl is written by a background thread from a queue of encoded records,
+        # started on the first error, and stays open between writes
+        self._json_errors_file = self.logs_dir / "errors.jsonl"
+        self._json_errors_lock = threading.Lock()
+        self._json_errors_queue: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._json_errors_thread: Optional[threading.Thread] = None
+        self._json_errors_closed = False
+        self._json_errors_fd: Optional[int] = None
+        self._json_errors_bytes = 0
+        self._json_errors_last_sync = 0.0
+        atexit.register(self._close_json_errors)
+
+        # Monitoring tracker queue and its worker task, bound to the running event loop
+        self._track_queue: Optional[asyncio.Queue] = None
+        self._track_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._track_task: Optional[asyncio.Task] = None
+
         self.app_logger = logging.getLogger("europa_app")
         self.app_logger.setLevel(logging.DEBUG)
 
@@ -54,11 +205,11 @@ class PersistentLogger:
             logger.handlers.clear()
             logger.propagate = False
 
-        detailed_formatter = logging.Formatter(
+        detailed_formatter = FastFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
         )
 
-        error_formatter = logging.Formatter(
+        error_formatter = FastFormatter(
             "%(asctime)s - EUROPA ERROR - %(levelname)s\n"
             "File: %(filename)s:%(lineno)d\n"
             "Function: %(funcName)s\n"
@@ -115,38 +266,39 @@ class PersistentLogger:
         self.app_logger.info("Python: %s", os.sys.version)
         self.app_logger.info("Working Directory: %s", os.getcwd())
 
-        # Log only essential environment variables to prevent memory leaks
-        essential_env = {
-            "PATH": os.environ.get("PATH", "")[:200],  # Truncate long PATH
-            "HOME": os.environ.get("HOME", ""),
-            "USER": os.environ.get("USER", ""),
-            "SHELL": os.environ.get("SHELL", ""),
-            "TERM": os.environ.get("TERM", ""),
-            "PYTHONPATH": os.environ.get("PYTHONPATH", ""),
-            "VIRTUAL_ENV": os.environ.get("VIRTUAL_ENV", ""),
-        }
-        # Remove empty values
-        essential_env = {k: v for k, v in essential_env.items() if v}
-        self.app_logger.info("Essential Environment: %s", essential_env)
+        # Log only essential, non-empty environment variables, truncated to keep the line bounded
+        environ = os.environ
+        essential_env = {key: environ[key][:STARTUP_ENV_MAX_CHARS] for key in STARTUP_ENV_KEYS if environ.get(key)}
+        try:
+            env_text = orjson.dumps(essential_env).decode("utf-8") if ORJSON_AVAILABLE else None
+        except TypeError:
+            # Undecodable bytes in a variable come through as lone surrogates, which orjson rejects
+            env_text = None
+        if env_text is None:
+            env_text = json.dumps(essential_env, separators=(",", ":"))
+        self.app_logger.info("Essential Environment: %s", env_text)
 
     def log_error(self, message: str, exception: Optional[Exception] = None, context: Optional[Dict[str, Any]] = None):
         """Log an error with full context"""
+        now_ns = time.time_ns()
         error_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(now_ns),
+            # Epoch seconds, so analysis can filter by time without parsing the timestamp string
+            "ts": now_ns / 1e9,
             "session_id": self.session_id,
             "message": message,
             "context": context or {},
         }
 
         if exception:
-            error_data["exception"] = {"type": type(exception).__name__, "message": str(exception), "args": exception.args}
+            error_data["exception"] = _exception_record(exception)
 
             self.error_logger.error(message, exc_info=exception, extra={"error_data": error_data})
             self.app_logger.error(message, exc_info=exception, extra={"error_data": error_data})
 
             # Track error in monitoring system
             if MONITORING_AVAILABLE and exception:
-                asyncio.create_task(error_tracker.track_error(exception, context))
+                self._track_error(exception, context)
                 metrics_collector.increment_counter("errors_total", labels={"type": type(exception).__name__})
         else:
             self.error_logger.error(message, extra={"error_data": error_data})
@@ -155,15 +307,45 @@ class PersistentLogger:
             # Track generic error in monitoring system
             if MONITORING_AVAILABLE:
                 generic_error = Exception(message)
-                asyncio.create_task(error_tracker.track_error(generic_error, context))
+                self._track_error(generic_error, context)
                 metrics_collector.increment_counter("errors_total", labels={"type": "generic"})
 
         self._write_json_error(error_data)
 
+    def _track_error(self, exception: Exception, context: Optional[Dict[str, Any]]):
+        """Queue an error for the monitoring tracker, dropping it without an event loop or when the queue is full"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._track_loop is not loop:
+            self._track_queue = asyncio.Queue(maxsize=TRACK_QUEUE_MAX)
+            self._track_loop = loop
+            self._track_task = loop.create_task(self._track_worker(self._track_queue))
+
+        try:
+            self._track_queue.put_nowait((exception, context))
+        except asyncio.QueueFull:
+            pass
+
+    async def _track_worker(self, pending: asyncio.Queue):
+        """Hand queued errors to the monitoring tracker in batches"""
+        while True:
+            batch = [await pending.get()]
+            while len(batch) < TRACK_BATCH_MAX and not pending.empty():
+                batch.append(pending.get_nowait())
+
+            try:
+                await error_tracker.track_error_many(batch)
+            except Exception:
+                # Monitoring must never take logging down with it
+                continue
+
     def log_warning(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log a warning"""
         warning_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
             "session_id": self.session_id,
             "message": message,
             "context": context or {},
@@ -177,7 +359,7 @@ class PersistentLogger:
 
     def log_mcp_error(self, server_name: str, message: str, exception: Optional[Exception] = None):
         """Log MCP server specific errors"""
-        mcp_context = {"server": server_name, "timestamp": datetime.now(timezone.utc).isoformat(), "session_id": self.session_id}
+        mcp_context = {"server": server_name, "timestamp": _utc_timestamp(), "session_id": self.session_id}
 
         error_msg = f"MCP Server '{server_name}': {message}"
 
@@ -189,19 +371,96 @@ class PersistentLogger:
 
     def _write_json_error(self, error_data: Dict[str, Any]):
         """Write error to JSON file for structured analysis"""
-        json_error_file = self.logs_dir / "errors.jsonl"
-
         try:
-            with open(json_error_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(error_data) + "\n")
+            payload = _dumps_jsonl(error_data)
+
+            if self._json_errors_closed:
+                # Writer thread already stopped at exit, write directly
+                self._write_json_batch([payload])
+                return
+
+            if self._json_errors_thread is None:
+                with self._json_errors_lock:
+                    if self._json_errors_thread is None:
+                        self._json_errors_thread = threading.Thread(target=self._drain_json_errors, name="europa-errors-jsonl", daemon=True)
+                        self._json_errors_thread.start()
+
+            self._json_errors_queue.put(payload)
         except Exception as e:
             print(f"CRITICAL: Failed to write error to JSON log: {e}")
             print(f"Original error data: {error_data}")
 
+    def _drain_json_errors(self):
+        """Writer thread: gather queued records into batches and write each batch at once"""
+        pending = self._json_errors_queue
+        running = True
+        while running:
+            batch = [pending.get()]
+            deadline = time.monotonic() + JSON_ERRORS_BATCH_WINDOW
+            while len(batch) < JSON_ERRORS_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # None is the stop signal from _close_json_errors
+            if None in batch:
+                running = False
+                batch = [payload for payload in batch if payload is not None]
+
+            if batch:
+                try:
+                    self._write_json_batch(batch)
+                except Exception as e:
+                    print(f"CRITICAL: Failed to write {len(batch)} errors to JSON log: {e}")
+
+    def _write_json_batch(self, batch: List[bytes]):
+        """Append encoded records to errors.jsonl in one vectored write, rolling the file over by size"""
+        with self._json_errors_lock:
+            if self._json_errors_fd is None:
+                self._json_errors_fd = os.open(self._json_errors_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._json_errors_bytes = os.fstat(self._json_errors_fd).st_size
+            fd = self._json_errors_fd
+
+            total = sum(map(len, batch))
+            written = os.writev(fd, batch) if hasattr(os, "writev") else 0
+            if written < total:
+                remainder = b"".join(batch)[written:]
+                while remainder:
+                    remainder = remainder[os.write(fd, remainder) :]
+            self._json_errors_bytes += total
+
+            now = time.monotonic()
+            if now - self._json_errors_last_sync >= JSON_ERRORS_SYNC_INTERVAL:
+                _fdatasync(fd)
+                self._json_errors_last_sync = now
+
+            if self._json_errors_bytes >= JSON_ERRORS_MAX_BYTES:
+                os.close(fd)
+                self._json_errors_fd = None
+                os.replace(self._json_errors_file, self._json_errors_file.with_name("errors.jsonl.1"))
+
+    def _close_json_errors(self):
+        """Flush queued errors and close errors.jsonl"""
+        self._json_errors_closed = True
+        if self._json_errors_thread is not None:
+            self._json_errors_queue.put(None)
+            self._json_errors_thread.join(timeout=5)
+
+        with self._json_errors_lock:
+            if self._json_errors_fd is not None:
+                os.close(self._json_errors_fd)
+                self._json_errors_fd = None
+
     def log_shutdown(self, reason: str = "normal", exit_code: int = 0):
         """Log shutdown information"""
+        now_ns = time.time_ns()
         shutdown_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(now_ns),
+            "ts": now_ns / 1e9,
             "session_id": self.session_id,
             "reason": reason,
             "exit_code": exit_code,
@@ -215,8 +474,8 @@ class PersistentLogger:
 
         json_shutdown_file = self.logs_dir / "sessions.jsonl"
         try:
-            with open(json_shutdown_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(shutdown_data) + "\n")
+            with open(json_shutdown_file, "ab") as f:
+                f.write(_dumps_jsonl(shutdown_data))
         except Exception as e:
             print(f"Failed to write shutdown data: {e}")
 
@@ -236,11 +495,7 @@ class PersistentLogger:
             if not error_file.exists():
                 return "No errors logged in this session."
 
-            with open(error_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            recent_errors = lines[-20:] if len(lines) > 20 else lines
-            return "".join(recent_errors)
+            return "".join(_tail_lines(error_file, ERROR_SUMMARY_LINES))
 
         except Exception as e:
             return f"Error reading error log: {e}"
@@ -280,6 +535,17 @@ def log_mcp_error(server_name: str, message: str, exception: Optional[Exception]
     persistent_logger.log_mcp_error(server_name, message, exception)
 
 
+async def close_monitoring():
+    """Release the monitoring tracker's network resources before the event loop goes away"""
+    if not MONITORING_AVAILABLE:
+        return
+    try:
+        await error_tracker.close()
+    except Exception:
+        # Shutdown carries on regardless
+        pass
+
+
 async def graceful_shutdown_delay(seconds: int = 3):
     """Provide delay before shutdown to allow log writing and user to see errors"""
     print(f"\n{'=' * 60}")
@@ -287,11 +553,10 @@ async def graceful_shutdown_delay(seconds: int = 3):
     print("Recent errors:")
     print(persistent_logger.create_error_summary())
     print(f"{'=' * 60}")
-    print(f"Shutting down in {seconds} seconds...")
+    print(f"Shutting down in {seconds} seconds...", flush=True)
 
-    for i in range(seconds, 0, -1):
-        print(f"  {i}...", end=" ", flush=True)
-        await asyncio.sleep(1)
+    # One cancellable wait instead of a per-second countdown
+    await asyncio.sleep(seconds)
 
-    print("\nShutdown complete.")
+    print("Shutdown complete.")
     persistent_logger.log_shutdown("error", 1)
@@ -199,7 +199,7 @@ class MCPAggregator(ContextDependent):
         async with self._prompt_cache_lock:
             self._prompt_cache.clear()
 
-        for server_name in self.server_names:
+        async def connect_server(server_name: str):
             if self.connection_persistence:
                 logger.info(
                     f"Creating persistent connection to server: {server_name}",
@@ -237,7 +237,10 @@ class MCPAggregator(ContextDependent):
                 },
             )
 
-        async def fetch_tools(client: ClientSession):
+        # Start the servers concurrently, so startup waits on the slowest server instead of all of them in turn
+        await gather(*(connect_server(server_name) for server_name in self.server_names))
+
+        async def fetch_tools(client: ClientSession, server_name: str):
             try:
                 result: ListToolsResult = await client.list_tools()
                 return result.tools or []
@@ -266,7 +269,7 @@ class MCPAggregator(ContextDependent):
                 server_connection = await self._persistent_connection_manager.get_server(
                     server_name, client_session_factory=MCPAgentClientSession
                 )
-                tools = await fetch_tools(server_connection.session)
+                tools = await fetch_tools(server_connection.session, server_name)
                 prompts = await fetch_prompts(server_connection.session, server_name)
             else:
                 # Create a factory function for the client session
@@ -291,7 +294,7 @@ class MCPAggregator(ContextDependent):
                     server_registry=self.context.server_registry,
                     client_session_factory=create_session,
                 ) as client:
-                    tools = await fetch_tools(client)
+                    tools = await fetch_tools(client, server_name)
                     prompts = await fetch_prompts(client, server_name)
 
             return server_name, tools, prompts
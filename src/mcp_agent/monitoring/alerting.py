@@ -3,14 +3,31 @@ Advanced Error Tracking and Alerting System for FastAgent
 Provides intelligent error classification, alerting, and recovery suggestions
 """
 
+import asyncio
+import functools
 import hashlib
+import heapq
 import json
 import time
 import traceback
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 # Optional email dependencies
 try:
@@ -23,6 +40,31 @@ except ImportError:
     EMAIL_AVAILABLE = False
 
 
+# Error counts at which determine_severity can change its answer for a category (> 3, > 5, > 10)
+_SEVERITY_STEPS = frozenset({4, 6, 11})
+
+
+def _fingerprint(text: str) -> str:
+    """Short non-cryptographic fingerprint of text, using xxHash when it is installed"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(text.encode())[:12]
+    return hashlib.md5(text.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the enums alert contexts carry by value, and anything else as a string"""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode("utf-8")
+
+
 class AlertSeverity(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -41,7 +83,7 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
     id: str
     timestamp: float
@@ -56,7 +98,15 @@ class ErrorEvent:
     last_seen: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
+class RecentError:
+    id: str
+    timestamp: float
+    category: str
+    message: str
+
+
+@dataclass(slots=True)
 class Alert:
     id: str
     severity: AlertSeverity
@@ -68,7 +118,7 @@ class Alert:
     resolved: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertRule:
     name: str
     condition: Callable[[Dict[str, Any]], bool]
@@ -76,6 +126,54 @@ class AlertRule:
     message_template: str
     cooldown_seconds: int = 300  # 5 minutes default
     enabled: bool = True
+    # Error categories the condition can match, None when it may match any
+    categories: Optional[FrozenSet[ErrorCategory]] = None
+
+    def format_message(self, context: Dict[str, Any]) -> str:
+        """Fill the message template from an alert context"""
+        # format_map reads the context directly instead of copying it into keyword arguments
+        return self.message_template.format_map(context)
+
+
+# Error storms repeat the same few errors, so categorizations are memoized
+@functools.lru_cache(maxsize=1024)
+def _categorize(exception_name: str, error_message: str, from_mcp_server: bool) -> ErrorCategory:
+    """Categorize an error from its lowercased exception type name and message"""
+    # Connection-related errors
+    if any(keyword in exception_name for keyword in ["connection", "network", "socket"]):
+        return ErrorCategory.CONNECTION
+
+    if any(keyword in error_message for keyword in ["connection refused", "network unreachable", "timeout"]):
+        return ErrorCategory.CONNECTION
+
+    # Authentication errors
+    if any(keyword in exception_name for keyword in ["auth", "permission", "access"]):
+        return ErrorCategory.AUTHENTICATION
+
+    if any(keyword in error_message for keyword in ["unauthorized", "forbidden", "invalid token", "api key"]):
+        return ErrorCategory.AUTHENTICATION
+
+    # Timeout errors
+    if "timeout" in exception_name or "timeout" in error_message:
+        return ErrorCategory.TIMEOUT
+
+    # Rate limiting
+    if any(keyword in error_message for keyword in ["rate limit", "too many requests", "429"]):
+        return ErrorCategory.RATE_LIMIT
+
+    # Validation errors
+    if any(keyword in exception_name for keyword in ["validation", "value", "type"]):
+        return ErrorCategory.VALIDATION
+
+    # System resource errors
+    if any(keyword in exception_name for keyword in ["memory", "disk", "resource"]):
+        return ErrorCategory.SYSTEM_RESOURCE
+
+    # MCP server errors
+    if from_mcp_server:
+        return ErrorCategory.MCP_SERVER
+
+    return ErrorCategory.UNKNOWN
 
 
 class ErrorTracker:
@@ -85,12 +183,19 @@ class ErrorTracker:
         self.max_errors = max_errors
         self.errors: Dict[str, ErrorEvent] = {}
         self.error_patterns: Dict[str, int] = defaultdict(int)
+        # Slotted records rather than dicts, less than half the size per entry
         self.recent_errors: deque = deque(maxlen=1000)
+        # Monotonic times of the recent errors still inside the error rate window, oldest first
+        self._rate_window: deque = deque(maxlen=1000)
 
         # Alert management
         self.alerts: Dict[str, Alert] = {}
         self.alert_rules: List[AlertRule] = []
         self.last_alert_times: Dict[str, float] = {}
+        # (rule name, error id) -> monotonic time the rule's cooldown for that error ends
+        self._rule_ready_at: Dict[Tuple[str, str], float] = {}
+        # Ids of errors whose current severity came from a category other than the event's own
+        self._recategorized: set = set()
 
         # Configuration
         self.config = {
@@ -102,6 +207,10 @@ class ErrorTracker:
             "slack_webhook": None,
         }
 
+        # Webhook HTTP session, created on the first webhook alert and bound to that event loop
+        self._webhook_session = None
+        self._webhook_loop: Optional[asyncio.AbstractEventLoop] = None
+
         self._setup_default_rules()
 
     def _setup_default_rules(self):
@@ -118,61 +227,27 @@ class ErrorTracker:
                 condition=lambda ctx: ctx.get("category") == ErrorCategory.SYSTEM_RESOURCE,
                 severity=AlertSeverity.CRITICAL,
                 message_template="Critical system resource error: {message}",
+                categories=frozenset({ErrorCategory.SYSTEM_RESOURCE}),
             ),
             AlertRule(
                 name="mcp_server_down",
                 condition=lambda ctx: ctx.get("category") == ErrorCategory.MCP_SERVER and ctx.get("consecutive_failures", 0) > 3,
                 severity=AlertSeverity.HIGH,
                 message_template="MCP Server {server_name} appears to be down (3+ consecutive failures)",
+                categories=frozenset({ErrorCategory.MCP_SERVER}),
             ),
             AlertRule(
                 name="authentication_failures",
                 condition=lambda ctx: ctx.get("category") == ErrorCategory.AUTHENTICATION and ctx.get("count", 0) > 5,
                 severity=AlertSeverity.MEDIUM,
                 message_template="Multiple authentication failures detected ({count} attempts)",
+                categories=frozenset({ErrorCategory.AUTHENTICATION}),
             ),
         ]
 
     def categorize_error(self, exception: Exception, context: Dict[str, Any]) -> ErrorCategory:
         """Categorize error based on exception type and context"""
-        exception_name = type(exception).__name__.lower()
-        error_message = str(exception).lower()
-
-        # Connection-related errors
-        if any(keyword in exception_name for keyword in ["connection", "network", "socket"]):
-            return ErrorCategory.CONNECTION
-
-        if any(keyword in error_message for keyword in ["connection refused", "network unreachable", "timeout"]):
-            return ErrorCategory.CONNECTION
-
-        # Authentication errors
-        if any(keyword in exception_name for keyword in ["auth", "permission", "access"]):
-            return ErrorCategory.AUTHENTICATION
-
-        if any(keyword in error_message for keyword in ["unauthorized", "forbidden", "invalid token", "api key"]):
-            return ErrorCategory.AUTHENTICATION
-
-        # Timeout errors
-        if "timeout" in exception_name or "timeout" in error_message:
-            return ErrorCategory.TIMEOUT
-
-        # Rate limiting
-        if any(keyword in error_message for keyword in ["rate limit", "too many requests", "429"]):
-            return ErrorCategory.RATE_LIMIT
-
-        # Validation errors
-        if any(keyword in exception_name for keyword in ["validation", "value", "type"]):
-            return ErrorCategory.VALIDATION
-
-        # System resource errors
-        if any(keyword in exception_name for keyword in ["memory", "disk", "resource"]):
-            return ErrorCategory.SYSTEM_RESOURCE
-
-        # MCP server errors
-        if context.get("source") == "mcp_server":
-            return ErrorCategory.MCP_SERVER
-
-        return ErrorCategory.UNKNOWN
+        return _categorize(type(exception).__name__.lower(), str(exception).lower(), context.get("source") == "mcp_server")
 
     def determine_severity(self, category: ErrorCategory, error_count: int, context: Dict[str, Any]) -> AlertSeverity:
         """Determine error severity based on category and context"""
@@ -192,56 +267,78 @@ class ErrorTracker:
 
     def generate_error_id(self, exception: Exception, context: Dict[str, Any]) -> str:
         """Generate unique error ID based on exception type and location"""
-        error_signature = f"{type(exception).__name__}:{exception}:{context.get('function', '')}"
-        return hashlib.md5(error_signature.encode()).hexdigest()[:12]
+        return self._error_id(type(exception).__name__, str(exception), context)
+
+    @staticmethod
+    def _error_id(exception_type: str, message: str, context: Dict[str, Any]) -> str:
+        """generate_error_id for an already formatted exception type and message"""
+        return _fingerprint(f"{exception_type}:{message}:{context.get('function', '')}")
 
     async def track_error(self, exception: Exception, context: Optional[Dict[str, Any]] = None):
         """Track an error event with intelligent categorization"""
         if context is None:
             context = {}
 
-        error_id = self.generate_error_id(exception, context)
+        exception_type = type(exception).__name__
+        message = str(exception)
+        error_id = self._error_id(exception_type, message, context)
         category = self.categorize_error(exception, context)
         current_time = time.time()
 
         # Update or create error event
-        if error_id in self.errors:
-            error_event = self.errors[error_id]
+        error_event = self.errors.get(error_id)
+        if error_event is not None:
             error_event.count += 1
             error_event.last_seen = current_time
+            # Severity only moves when the count crosses a threshold, or when the category differs from the one it came from
+            recategorized = category is not error_event.category
+            if error_event.count in _SEVERITY_STEPS or recategorized or error_id in self._recategorized:
+                error_event.severity = self.determine_severity(category, error_event.count, context)
+                if recategorized:
+                    self._recategorized.add(error_id)
+                else:
+                    self._recategorized.discard(error_id)
         else:
             error_event = ErrorEvent(
                 id=error_id,
                 timestamp=current_time,
                 category=category,
                 severity=self.determine_severity(category, 1, context),
-                message=str(exception),
-                exception_type=type(exception).__name__,
-                stack_trace=traceback.format_exc(),
+                message=message,
+                exception_type=exception_type,
+                # The exception's own traceback, which is right even when called outside its except block
+                stack_trace="".join(traceback.format_exception(exception)),
                 context=context,
                 first_seen=current_time,
                 last_seen=current_time,
             )
             self.errors[error_id] = error_event
 
-        # Update severity based on new count
-        error_event.severity = self.determine_severity(category, error_event.count, context)
-
         # Add to recent errors
-        self.recent_errors.append({"id": error_id, "timestamp": current_time, "category": category.value, "message": str(exception)})
+        self.recent_errors.append(RecentError(error_id, current_time, category.value, message))
+        self._rate_window.append(time.monotonic())
 
         # Check alert conditions
         await self._check_alert_conditions(error_event)
 
         # Clean up old errors if we exceed max
         if len(self.errors) > self.max_errors:
-            oldest_errors = sorted(self.errors.values(), key=lambda e: e.last_seen)
-            for old_error in oldest_errors[:100]:  # Remove oldest 100
+            # Remove oldest 100, selecting them without sorting every tracked error
+            oldest_errors = heapq.nsmallest(100, self.errors.values(), key=lambda e: e.last_seen)
+            for old_error in oldest_errors:
                 del self.errors[old_error.id]
+                self._recategorized.discard(old_error.id)
+
+    async def track_error_many(self, errors: List[Tuple[Exception, Optional[Dict[str, Any]]]]):
+        """Track a batch of (exception, context) error events"""
+        for exception, context in errors:
+            await self.track_error(exception, context)
 
     async def _check_alert_conditions(self, error_event: ErrorEvent):
         """Check if error event triggers any alert rules"""
         current_time = time.time()
+        # Cooldowns are measured on the monotonic clock, so wall clock adjustments do not shift them
+        now = time.monotonic()
 
         # Calculate metrics for alert rules
         error_rate = self._calculate_error_rate()
@@ -259,31 +356,37 @@ class ErrorTracker:
             if not rule.enabled:
                 continue
 
-            rule_key = f"{rule.name}_{error_event.id}"
+            # Rules limited to other categories cannot match
+            if rule.categories is not None and error_event.category not in rule.categories:
+                continue
 
             # Check cooldown
-            if rule_key in self.last_alert_times and current_time - self.last_alert_times[rule_key] < rule.cooldown_seconds:
+            ready_key = (rule.name, error_event.id)
+            if self._rule_ready_at.get(ready_key, 0.0) > now:
                 continue
 
             # Check condition
             if rule.condition(alert_context):
                 await self._create_alert(rule, alert_context, error_event)
-                self.last_alert_times[rule_key] = current_time
+                self.last_alert_times[f"{rule.name}_{error_event.id}"] = current_time
+                self._rule_ready_at[ready_key] = now + rule.cooldown_seconds
 
     def _calculate_error_rate(self) -> float:
         """Calculate errors per minute over last 5 minutes"""
-        current_time = time.time()
-        cutoff_time = current_time - 300  # 5 minutes
+        cutoff_time = time.monotonic() - 300  # 5 minutes
 
-        recent_count = sum(1 for error in self.recent_errors if error["timestamp"] > cutoff_time)
+        # Errors are appended in time order, so the expired ones are at the front
+        window = self._rate_window
+        while window and window[0] <= cutoff_time:
+            window.popleft()
 
-        return recent_count / 5  # errors per minute
+        return len(window) / 5  # errors per minute
 
     async def _create_alert(self, rule: AlertRule, context: Dict[str, Any], error_event: ErrorEvent):
         """Create and send alert"""
         alert_id = f"{rule.name}_{int(time.time())}"
 
-        message = rule.message_template.format(**context)
+        message = rule.format_message(context)
 
         alert = Alert(
             id=alert_id,
@@ -328,7 +431,7 @@ Time: {time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(alert.timestamp))}
 Message: {alert.message}
 
 Context:
-{json.dumps(alert.context, indent=2)}
+{_dumps(alert.context, indent=True).decode("utf-8")}
             """
 
             msg.attach(MimeText(body, "plain"))
@@ -343,8 +446,6 @@ Context:
     async def _send_webhook_alert(self, alert: Alert):
         """Send alert via webhook"""
         try:
-            import aiohttp
-
             payload = {
                 "alert_id": alert.id,
                 "severity": alert.severity.value,
@@ -354,39 +455,72 @@ Context:
                 "context": alert.context,
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.config["webhook_url"], json=payload) as response:
-                    if response.status != 200:
-                        print(f"Webhook alert failed: {response.status}")
+            session = await self._get_webhook_session()
+            async with session.post(
+                self.config["webhook_url"], data=_dumps(payload), headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status != 200:
+                    print(f"Webhook alert failed: {response.status}")
 
         except Exception as e:
             print(f"Failed to send webhook alert: {e}")
 
+    async def _get_webhook_session(self):
+        """Shared aiohttp session for webhook alerts, so connections are reused between alerts"""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._webhook_session
+        if session is None or session.closed or self._webhook_loop is not loop:
+            if session is not None and not session.closed:
+                # Opened on an earlier event loop, which may already be closed
+                try:
+                    await session.close()
+                except Exception:
+                    pass
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300), timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._webhook_session = session
+            self._webhook_loop = loop
+        return session
+
+    async def close(self):
+        """Close the webhook HTTP session, if one was opened"""
+        session, self._webhook_session = self._webhook_session, None
+        if session is not None and not session.closed:
+            await session.close()
+
     def get_error_summary(self) -> Dict[str, Any]:
         """Get comprehensive error summary"""
         current_time = time.time()
 
-        # Group errors by category
+        # Group errors by category and severity, and count totals and recent errors (last hour), in one pass
         category_counts = defaultdict(int)
         severity_counts = defaultdict(int)
+        total_error_count = 0
+        recent_errors_count = 0
+        recent_cutoff = current_time - 3600
 
         for error in self.errors.values():
             category_counts[error.category.value] += error.count
             severity_counts[error.severity.value] += 1
+            total_error_count += error.count
+            if error.last_seen > recent_cutoff:
+                recent_errors_count += 1
 
-        # Recent errors (last hour)
-        recent_cutoff = current_time - 3600
-        recent_errors = [e for e in self.errors.values() if e.last_seen > recent_cutoff]
+        # Only the ten most frequent errors are reported, so select them without sorting every error
+        top_errors = heapq.nlargest(10, self.errors.values(), key=lambda e: e.count)
 
         return {
             "total_unique_errors": len(self.errors),
-            "total_error_count": sum(e.count for e in self.errors.values()),
-            "recent_errors_count": len(recent_errors),
+            "total_error_count": total_error_count,
+            "recent_errors_count": recent_errors_count,
             "error_rate_per_minute": self._calculate_error_rate(),
             "category_breakdown": dict(category_counts),
             "severity_breakdown": dict(severity_counts),
             "active_alerts": len([a for a in self.alerts.values() if not a.resolved]),
-            "top_errors": sorted([(e.id, e.message, e.count) for e in self.errors.values()], key=lambda x: x[2], reverse=True)[:10],
+            "top_errors": [(e.id, e.message, e.count) for e in top_errors],
         }
 
     def configure_alerts(self, config: Dict[str, Any]):
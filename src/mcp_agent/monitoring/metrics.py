@@ -4,7 +4,9 @@ Tracks performance metrics, response times, and error rates
 """
 
 import asyncio
+import bisect
 import json
+import os
 import statistics
 import threading
 import time
@@ -14,6 +16,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Deque, Dict, List, Optional
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class MetricType(Enum):
     COUNTER = "counter"
@@ -22,7 +31,7 @@ class MetricType(Enum):
     TIMER = "timer"
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     name: str
     type: MetricType
@@ -32,7 +41,7 @@ class Metric:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricSummary:
     name: str
     count: int
@@ -52,8 +61,12 @@ class MetricsCollector:
         self.max_samples = max_samples
         self._lock = threading.RLock()
 
-        # Storage for different metric types
-        self.counters: Dict[str, float] = defaultdict(float)
+        # Storage for different metric types. Counter names are interned to list indexes, and
+        # counts are kept in one list per thread, so increments take no lock; reads sum them up
+        self._counter_ids: Dict[str, int] = {}
+        self._counter_names: List[str] = []
+        self._counter_shards: List[List[float]] = []
+        self._local = threading.local()
         self.gauges: Dict[str, float] = {}
         self.histograms: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=max_samples))
         self.timers: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=max_samples))
@@ -71,13 +84,63 @@ class MetricsCollector:
         self.response_times: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=1000))
 
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
+
+        # Serializes export_metrics calls, so concurrent exports do not interleave their writes.
+        # An asyncio lock is bound to one event loop, so it is created per running loop
+        self._export_lock: Optional[asyncio.Lock] = None
+        self._export_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def counters(self) -> Dict[str, float]:
+        """Current counter totals over all threads"""
+        with self._lock:
+            names = list(self._counter_names)
+            shards = list(self._counter_shards)
+        totals = [0.0] * len(names)
+        seen = 0
+        for shard in shards:
+            # Counters registered after the name snapshot are left for the next read
+            shard = shard[: len(names)]
+            seen = max(seen, len(shard))
+            for counter_id, value in enumerate(shard):
+                totals[counter_id] += value
+        return defaultdict(float, zip(names[:seen], totals))
+
+    def _register_counter(self, name: str) -> int:
+        """Intern a counter name, returning its index in the thread shards"""
+        with self._lock:
+            counter_id = self._counter_ids.get(name)
+            if counter_id is None:
+                counter_id = len(self._counter_names)
+                self._counter_names.append(name)
+                self._counter_ids[name] = counter_id
+            return counter_id
+
+    def _register_counter_shard(self) -> List[float]:
+        """Create the calling thread's counter shard"""
+        shard = self._local.counters = []
+        with self._lock:
+            self._counter_shards.append(shard)
+        return shard
 
     def increment_counter(self, name: str, value: float = 1.0, labels: Optional[Dict[str, str]] = None):
         """Increment a counter metric"""
-        with self._lock:
-            self.counters[name] += value
-            if labels:
-                self.metric_labels[name] = labels
+        counter_id = self._counter_ids.get(name)
+        if counter_id is None:
+            counter_id = self._register_counter(name)
+        try:
+            shard = self._local.counters
+        except AttributeError:
+            shard = self._register_counter_shard()
+        # Only the owning thread writes to its shard
+        try:
+            shard[counter_id] += value
+        except IndexError:
+            shard.extend([0.0] * (counter_id + 1 - len(shard)))
+            shard[counter_id] += value
+        if labels:
+            self.metric_labels[name] = labels
 
     def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Set a gauge metric value"""
@@ -108,9 +171,9 @@ class MetricsCollector:
 
             if not success:
                 self.error_counts[endpoint] += 1
-                # Calculate error rate (errors per minute)
-                current_time = time.time()
-                self.error_rates[endpoint].append(current_time)
+                # Calculate error rate (errors per minute), on the monotonic clock. Appending under
+                # the lock keeps each deque in time order, which _error_rate_since relies on
+                self.error_rates[endpoint].append(time.monotonic())
 
     def get_error_rate(self, endpoint: str, window_minutes: int = 5) -> float:
         """Calculate error rate for an endpoint over time window"""
@@ -118,18 +181,20 @@ class MetricsCollector:
             if endpoint not in self.error_rates:
                 return 0.0
 
-            current_time = time.time()
-            cutoff_time = current_time - (window_minutes * 60)
+            return self._error_rate_since(endpoint, time.monotonic() - (window_minutes * 60))
 
-            # Count errors in time window
-            recent_errors = sum(1 for error_time in self.error_rates[endpoint] if error_time > cutoff_time)
+    def _error_rate_since(self, endpoint: str, cutoff_time: float) -> float:
+        """Error rate for an endpoint since cutoff_time, called with the lock held"""
+        # Get total requests in same window (approximate)
+        total_requests = self.request_counts.get(endpoint, 0)
+        if total_requests == 0:
+            return 0.0
 
-            # Get total requests in same window (approximate)
-            total_requests = self.request_counts.get(endpoint, 0)
-            if total_requests == 0:
-                return 0.0
+        # Count errors in time window, by bisecting the time ordered deque instead of scanning it
+        error_times = self.error_rates[endpoint]
+        recent_errors = len(error_times) - bisect.bisect_right(error_times, cutoff_time)
 
-            return (recent_errors / total_requests) * 100
+        return (recent_errors / total_requests) * 100
 
     def get_response_time_stats(self, endpoint: str) -> Optional[MetricSummary]:
         """Get response time statistics for an endpoint"""
@@ -137,25 +202,33 @@ class MetricsCollector:
             if endpoint not in self.response_times or not self.response_times[endpoint]:
                 return None
 
-            times = list(self.response_times[endpoint])
+            # One sort gives the min, max, median and percentiles
+            sorted_times = sorted(self.response_times[endpoint])
+            count = len(sorted_times)
+            middle = count // 2
+            median = sorted_times[middle] if count % 2 else (sorted_times[middle - 1] + sorted_times[middle]) / 2
 
             return MetricSummary(
                 name=f"{endpoint}_response_time",
-                count=len(times),
-                min_value=min(times),
-                max_value=max(times),
-                avg_value=statistics.mean(times),
-                median_value=statistics.median(times),
-                p95_value=self._percentile(times, 95),
-                p99_value=self._percentile(times, 99),
+                count=count,
+                min_value=sorted_times[0],
+                max_value=sorted_times[-1],
+                avg_value=statistics.fmean(sorted_times),
+                median_value=median,
+                p95_value=self._sorted_percentile(sorted_times, 95),
+                p99_value=self._sorted_percentile(sorted_times, 99),
                 last_updated=time.time(),
             )
 
     def _percentile(self, data: List[float], percentile: float) -> float:
         """Calculate percentile of data"""
-        if not data:
+        return self._sorted_percentile(sorted(data), percentile)
+
+    @staticmethod
+    def _sorted_percentile(sorted_data: List[float], percentile: float) -> float:
+        """Calculate percentile of already sorted data"""
+        if not sorted_data:
             return 0.0
-        sorted_data = sorted(data)
         index = (percentile / 100) * (len(sorted_data) - 1)
 
         if index.is_integer():
@@ -170,7 +243,7 @@ class MetricsCollector:
         with self._lock:
             metrics = {
                 "timestamp": time.time(),
-                "uptime_seconds": time.time() - self.start_time,
+                "uptime_seconds": time.monotonic() - self._start_monotonic,
                 "counters": dict(self.counters),
                 "gauges": dict(self.gauges),
                 "request_counts": dict(self.request_counts),
@@ -193,18 +266,39 @@ class MetricsCollector:
                         "p99_ms": stats.p99_value,
                     }
 
-            # Add error rates
+            # Add error rates, all over the same default 5 minute window
+            cutoff_time = time.monotonic() - 5 * 60
             for endpoint in self.error_rates:
-                metrics["error_rates"][endpoint] = self.get_error_rate(endpoint)
+                metrics["error_rates"][endpoint] = self._error_rate_since(endpoint, cutoff_time)
 
             return metrics
 
     async def export_metrics(self, file_path: Path):
         """Export metrics to JSON file"""
         metrics = self.get_all_metrics()
-        async with asyncio.Lock():
-            with open(file_path, "w") as f:
-                json.dump(metrics, f, indent=2)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(metrics, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(metrics, indent=2).encode("utf-8")
+
+        loop = asyncio.get_running_loop()
+        if self._export_loop is not loop:
+            self._export_lock = asyncio.Lock()
+            self._export_loop = loop
+
+        async with self._export_lock:
+            await asyncio.to_thread(_write_atomic, Path(file_path), payload)
+
+
+def _write_atomic(file_path: Path, payload: bytes):
+    """Write payload next to file_path and rename it into place, so readers never see a partial file"""
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 class TimerContext:
@@ -217,12 +311,12 @@ class TimerContext:
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.start_time:
-            duration = (time.time() - self.start_time) * 1000  # Convert to milliseconds
+            duration = (time.perf_counter() - self.start_time) * 1000  # Convert to milliseconds
             self.collector.record_timer(self.metric_name, duration, self.labels)
 
 
@@ -237,7 +331,7 @@ class RequestTracker:
 
         def decorator(func):
             async def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 success = True
                 try:
                     result = await func(*args, **kwargs)
@@ -246,7 +340,7 @@ class RequestTracker:
                     success = False
                     raise
                 finally:
-                    response_time = (time.time() - start_time) * 1000
+                    response_time = (time.perf_counter() - start_time) * 1000
                     self.collector.record_request(endpoint, response_time, success)
 
             return wrapper
@@ -4,49 +4,93 @@ Request Caching Utility for MCP Servers
 Provides simple in-memory caching with TTL support for API calls
 """
 
-import hashlib
+import heapq
+import itertools
 import time
-from typing import Any, Dict, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
+# Headers that do not change the response and are left out of cache keys
+_UNCACHED_HEADERS = frozenset({"authorization", "user-agent", "accept-encoding"})
+
+# (method, url, sorted params, sorted headers, body), compared and hashed as a tuple by the cache dict
+CacheKey = Tuple[str, str, Tuple[Tuple[Any, str], ...], Tuple[Tuple[str, str], ...], Optional[Union[str, bytes]]]
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """The parts of a response needed to rebuild it, without its connection or raw stream"""
+
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    url: str
+    reason: Optional[str]
+    encoding: Optional[str]
+    expires_at: float  # time.monotonic()
+    cached_at: float  # time.time()
+
+    @classmethod
+    def from_response(cls, response: requests.Response, ttl: float) -> "CacheEntry":
+        """Capture a response for caching, expiring after ttl seconds"""
+        # Reading content consumes the body, which hands the connection back to the pool
+        return cls(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            url=response.url,
+            reason=response.reason,
+            encoding=response.encoding,
+            # Expiry is on the monotonic clock, cached_at stays a wall clock time
+            expires_at=time.monotonic() + ttl,
+            cached_at=time.time(),
+        )
+
+    def to_response(self) -> requests.Response:
+        """Build a fresh, fully read response from the cached parts"""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response._content_consumed = True
+        response.url = self.url
+        response.reason = self.reason
+        response.encoding = self.encoding
+        return response
+
 
 class RequestCache:
     """Simple in-memory cache with TTL for HTTP requests"""
 
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, default_ttl: int = 300, max_entries: int = 10000):  # 5 minutes default
+        # Least recently used first
+        self._cache: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        # (expires_at, sequence, key) for every entry set; stale items are skipped when popped
+        self._expiry_heap: List[Tuple[float, int, CacheKey]] = []
+        self._sequence = itertools.count()
 
     def _generate_key(
         self, method: str, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, data: Optional[Union[str, bytes]] = None
-    ) -> str:
+    ) -> CacheKey:
         """Generate cache key from request parameters"""
-        key_data = f"{method.upper()}:{url}"
-
-        if params:
-            sorted_params = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-            key_data += f"?{sorted_params}"
-
-        if headers:
-            # Only include relevant headers for caching
-            cache_headers = {k: v for k, v in headers.items() if k.lower() not in ["authorization", "user-agent", "accept-encoding"]}
-            if cache_headers:
-                sorted_headers = "&".join(f"{k}={v}" for k, v in sorted(cache_headers.items()))
-                key_data += f"#{sorted_headers}"
-
-        if data:
-            if isinstance(data, bytes):
-                data = data.decode("utf-8", errors="ignore")
-            key_data += f":{data}"
-
-        return hashlib.md5(key_data.encode()).hexdigest()
-
-    def _is_expired(self, cache_entry: Dict[str, Any]) -> bool:
+        params_key = tuple(sorted((k, str(v)) for k, v in params.items())) if params else ()
+        # Only include relevant headers for caching
+        headers_key = tuple(sorted((k, str(v)) for k, v in headers.items() if k.lower() not in _UNCACHED_HEADERS)) if headers else ()
+        if data and not isinstance(data, (str, bytes)):
+            data = str(data)
+        return (method.upper(), url, params_key, headers_key, data or None)
+
+    def _is_expired(self, cache_entry: CacheEntry) -> bool:
         """Check if cache entry has expired"""
-        return time.time() > cache_entry["expires_at"]
+        return time.monotonic() > cache_entry.expires_at
 
     def get(
         self, method: str, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, data: Optional[Union[str, bytes]] = None
@@ -58,7 +102,8 @@ class RequestCache:
             entry = self._cache[cache_key]
             if not self._is_expired(entry):
                 # Return cached response
-                return entry["response"]
+                self._cache.move_to_end(cache_key)
+                return entry.to_response()
             else:
                 # Remove expired entry
                 del self._cache[cache_key]
@@ -83,24 +128,41 @@ class RequestCache:
 
         # Only cache successful responses
         if 200 <= response.status_code < 400:
-            self._cache[cache_key] = {"response": response, "expires_at": time.time() + ttl, "cached_at": time.time()}
+            entry = CacheEntry.from_response(response, ttl)
+            self._cache[cache_key] = entry
+            self._cache.move_to_end(cache_key)
+            heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._sequence), cache_key))
+
+            self.clear_expired()
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+            # Overwritten and evicted entries leave stale heap items behind, rebuild once they dominate
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._expiry_heap = [(e.expires_at, next(self._sequence), key) for key, e in self._cache.items()]
+                heapq.heapify(self._expiry_heap)
 
     def clear_expired(self):
         """Remove all expired entries"""
-        current_time = time.time()
-        expired_keys = [key for key, entry in self._cache.items() if current_time > entry["expires_at"]]
+        current_time = time.monotonic()
+        heap = self._expiry_heap
 
-        for key in expired_keys:
-            del self._cache[key]
+        while heap and heap[0][0] < current_time:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # The key may have been set again since, with a later expiry
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
 
     def clear_all(self):
         """Clear entire cache"""
         self._cache.clear()
+        self._expiry_heap.clear()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        current_time = time.time()
-        expired_count = sum(1 for entry in self._cache.values() if current_time > entry["expires_at"])
+        current_time = time.monotonic()
+        expired_count = sum(1 for entry in self._cache.values() if current_time > entry.expires_at)
 
         return {"total_entries": len(self._cache), "active_entries": len(self._cache) - expired_count, "expired_entries": expired_count}
 
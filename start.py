@@ -1,35 +1,52 @@
 #!/usr/bin/env python3
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Optional
 
-import yaml
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# JSON copy of the parsed config, reused by later starts until the YAML contents change.
+# EUROPA_CONFIG_CACHE=0 turns it off, e.g. while editing the file. Secrets never get one
+CONFIG_CACHE_FILE = "fastagent.config.cache.json"
+CONFIG_CACHE_ENABLED = os.environ.get("EUROPA_CONFIG_CACHE", "1") != "0"
 
 try:
-    from weather import get_simple_weather
+    from weather import get_startup_weather
 except ImportError:
 
-    def get_simple_weather():
+    def get_startup_weather():
         return "Weather module unavailable"
 
 
 PROJECT_ROOT = Path(__file__).parent.resolve()
 
+# First on sys.path, so an installed src, weather or version package cannot shadow the project's own
 path_str = str(PROJECT_ROOT)
 if path_str not in sys.path:
     sys.path.insert(0, path_str)
 
+# Plain strings for the tmux command lines, built once
+F1_PATH = os.path.join(path_str, "f1-mcp")
+
 try:
     # Import monitoring for potential future use (referenced in persistent_logger)
     import src.mcp_agent.monitoring  # noqa: F401
     from src.mcp_agent.logging.error_handler import catch_and_log, setup_global_exception_handler
     from src.mcp_agent.logging.log_manager import log_manager
-    from src.mcp_agent.logging.persistent_logger import log_error, log_info, log_warning, persistent_logger
+    from src.mcp_agent.logging.persistent_logger import close_monitoring, log_error, log_info, log_warning, persistent_logger
 
     MONITORING_AVAILABLE = True
 except ImportError as e:
@@ -53,11 +70,15 @@ except ImportError as e:
     def setup_global_exception_handler():
         pass
 
+    async def close_monitoring():
+        pass
+
 
 try:
     import importlib.util
     import shutil
 
+    from maestro_instruction import MAESTRO_INSTRUCTION
     from mcp_agent.core.fastagent import FastAgent
     from mcp_agent.core.request_params import RequestParams
     from version import __version__
@@ -68,10 +89,12 @@ except ImportError as e:
 
 setup_global_exception_handler()
 
-logging.basicConfig(
-    level=logging.CRITICAL,  # Only show critical messages from external libs
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Left alone when the embedding process (a supervisor, a test runner) has configured logging already
+if not logging.getLogger().hasHandlers():
+    logging.basicConfig(
+        level=logging.CRITICAL,  # Only show critical messages from external libs
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
 for logger_name in ["google_genai.models", "httpx", "mcp_agent", "urllib3", "asyncio"]:
     logging.getLogger(logger_name).setLevel(logging.CRITICAL)
@@ -89,51 +112,193 @@ Usage:
 """
 
 
+@functools.cache
+def _yaml_loader():
+    """libyaml's C loader when PyYAML was built with it, the pure Python SafeLoader otherwise"""
+    import yaml
+
+    if not getattr(yaml, "__with_libyaml__", False):
+        log_warning("PyYAML was built without libyaml - config files are parsed with the slower pure Python loader")
+        return yaml.SafeLoader
+    return yaml.CSafeLoader
+
+
+def _yaml_error():
+    """yaml.YAMLError, for except clauses in code that only imports PyYAML when it has to parse"""
+    import yaml
+
+    return yaml.YAMLError
+
+
+def _load_yaml_cache(cache_file: Path, digest: str) -> Optional[Any]:
+    """Return the cached parse from a JSON sidecar, or None when it is missing or stale"""
+    try:
+        with open(cache_file, "rb") as f:
+            raw = f.read()
+        # orjson.JSONDecodeError is a ValueError too
+        cached = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+    # The cache records a hash of the YAML bytes it was built from
+    if not isinstance(cached, dict) or cached.get("source") != digest:
+        return None
+    return cached.get("data")
+
+
+def _save_yaml_cache(cache_file: Path, digest: str, data: Any):
+    """Write a parsed YAML file to its JSON sidecar, atomically and readable by the owner only"""
+    try:
+        payload = json.dumps({"source": digest, "data": data})
+    except (TypeError, ValueError):
+        # Values JSON cannot hold (dates, binary) are left to the YAML parse every time
+        return
+    if json.loads(payload)["data"] != data:
+        # Keys JSON would turn into strings
+        return
+
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        log_warning("Could not write config cache", context={"file": str(cache_file), "error": str(e)})
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def _new_digest():
+    """Hash used to key the JSON sidecars"""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _file_digest(f: BinaryIO) -> str:
+    """Hex digest of an open binary file, streamed into the hash rather than read into one bytes object"""
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+, reads straight into the C hash state
+        return hashlib.file_digest(f, _new_digest).hexdigest()
+    digest = _new_digest()
+    for chunk in iter(lambda: f.read(65536), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_yaml(f: BinaryIO) -> Any:
+    """Parse an open YAML file from the start"""
+    import yaml
+
+    # Raw bytes, libyaml decodes them itself instead of pulling text through a file object
+    f.seek(0)
+    return yaml.load(f.read(), Loader=_yaml_loader())
+
+
+def _parse_yaml_cached(f: BinaryIO, cache_file: Path) -> Any:
+    """Parse an open YAML file, reusing the JSON sidecar while its contents are unchanged"""
+    digest = _file_digest(f)
+
+    if CONFIG_CACHE_ENABLED:
+        data = _load_yaml_cache(cache_file, digest)
+        if data is not None:
+            return data
+
+    # PyYAML is only imported when there is no usable cache
+    data = _parse_yaml(f)
+    if CONFIG_CACHE_ENABLED and isinstance(data, dict):
+        _save_yaml_cache(cache_file, digest, data)
+    return data
+
+
 class ConfigManager:
     _instance = None
+    # Parsed files and the (st_mtime_ns, st_size) they were parsed at, so a change on disk is picked up by one stat
     _config_cache: Dict[str, Any] = {}
     _secrets_cache: Optional[Dict[str, Any]] = None
+    _secrets_key: Optional[tuple] = None
+    _secrets_warned_mode = 0
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    def get_config(self) -> Any:
+        """Parsed fastagent.config.yaml, parsed again only when the file changes"""
+        config_file = Path("fastagent.config.yaml")
+        stat_info = config_file.stat()
+        key = (stat_info.st_mtime_ns, stat_info.st_size)
+
+        cached = self._config_cache.get(str(config_file))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Key and contents both come from one descriptor, so they describe the same version of the file
+        with open(config_file, "rb") as f:
+            stat_info = os.fstat(f.fileno())
+            config = _parse_yaml_cached(f, config_file.with_name(CONFIG_CACHE_FILE))
+        key = (stat_info.st_mtime_ns, stat_info.st_size)
+        self._config_cache[str(config_file)] = (key, config)
+        return config
+
     def get_secrets(self) -> Dict[str, Any]:
-        if self._secrets_cache is not None:
+        secrets_file = Path("fastagent.secrets.yaml")
+        try:
+            stat_info = secrets_file.stat()
+        except OSError:
+            stat_info = None
+
+        key = (stat_info.st_mtime_ns, stat_info.st_size) if stat_info is not None else None
+        if self._secrets_cache is not None and self._secrets_key == key:
             return self._secrets_cache
+        self._secrets_key = key
 
-        secrets_file = Path("fastagent.secrets.yaml")
-        if not secrets_file.exists():
+        if stat_info is None:
             log_warning("No fastagent.secrets.yaml found - some features may not work")
             self._secrets_cache = {}
             return self._secrets_cache
 
         try:
-            stat_info = secrets_file.stat()
-            if stat_info.st_mode & 0o077:
-                log_warning("Secrets file has unsafe permissions - should be 600")
-
-            with open(secrets_file, "r", encoding="utf-8") as f:
-                secrets = yaml.safe_load(f) or {}
-
-                if not isinstance(secrets, dict):
-                    log_error("Invalid secrets file format - must be a YAML dictionary")
-                    return {}
-
-                cleaned_secrets = {}
-                for key, value in secrets.items():
-                    if value is not None and value != "":
-                        cleaned_secrets[key] = value
+            # The permission check and cache key come from the descriptor the contents are read from
+            try:
+                f = open(secrets_file, "rb")
+            except FileNotFoundError:
+                log_warning("No fastagent.secrets.yaml found - some features may not work")
+                self._secrets_key = None
+                self._secrets_cache = {}
+                return self._secrets_cache
 
-                log_info("Successfully loaded secrets configuration", context={"keys_count": len(cleaned_secrets)})
-                self._secrets_cache = cleaned_secrets
+            with f:
+                stat_info = os.fstat(f.fileno())
+                self._secrets_key = (stat_info.st_mtime_ns, stat_info.st_size)
+
+                # Warned once per mode, not again on every reload of an unchanged-permission file
+                unsafe_mode = stat_info.st_mode & 0o077
+                if unsafe_mode and unsafe_mode != self._secrets_warned_mode:
+                    log_warning("Secrets file has unsafe permissions - should be 600")
+                self._secrets_warned_mode = unsafe_mode
+
+                try:
+                    # Parsed every time the file changes, so the keys are never written out a second time
+                    secrets = _parse_yaml(f) or {}
+                except _yaml_error() as e:
+                    log_error("Failed to parse YAML secrets file", exception=e, context={"file": str(secrets_file)})
+                    self._secrets_cache = {}
+                    return self._secrets_cache
+
+            if not isinstance(secrets, dict):
+                log_error("Invalid secrets file format - must be a YAML dictionary")
+                self._secrets_cache = {}
                 return self._secrets_cache
 
-        except yaml.YAMLError as e:
-            log_error("Failed to parse YAML secrets file", exception=e, context={"file": str(secrets_file)})
-            self._secrets_cache = {}
+            cleaned_secrets = {key: value for key, value in secrets.items() if value not in (None, "")}
+
+            log_info("Successfully loaded secrets configuration", context={"keys_count": len(cleaned_secrets)})
+            self._secrets_cache = cleaned_secrets
             return self._secrets_cache
+
         except Exception as e:
             log_error("Failed to load secrets file", exception=e, context={"file": str(secrets_file)})
             self._secrets_cache = {}
@@ -143,25 +308,47 @@ class ConfigManager:
 config_manager = ConfigManager()
 
 
+# Executables the MCP servers are launched with, in the order validate_mcp_dependencies unpacks them
+DEPENDENCY_COMMANDS = ("npm", "uv", "uvx", "openapi-generator-cli")
+
+
+@functools.cache
+def _which(command: str) -> bool:
+    """Whether a command is on PATH, looked up once per process"""
+    return shutil.which(command) is not None
+
+
+@functools.cache
+def _has_module(name: str) -> bool:
+    """Whether a module can be imported, looked up once per process"""
+    return importlib.util.find_spec(name) is not None
+
+
 def validate_mcp_dependencies() -> Dict[str, Dict[str, bool]]:
     """Validate dependencies for MCP servers and return status."""
-    dependencies = {
+    # Independent PATH walks, probed in parallel rather than one after the other
+    with ThreadPoolExecutor(max_workers=len(DEPENDENCY_COMMANDS)) as pool:
+        npm_ok, uv_ok, uvx_ok, openapi_generator_ok = pool.map(_which, DEPENDENCY_COMMANDS)
+    requests_ok = _has_module("requests")
+    yaml_ok = _has_module("yaml")
+
+    return {
         "spotify": {
             "cryptography": True,
-            "requests": True,
-            "yaml": True,
+            "requests": requests_ok,
+            "yaml": yaml_ok,
         },
         # "google-calendar": {
         #     "cryptography": True,
-        #     "requests": True,
-        #     "yaml": True,
-        #     "dateutil": bool(importlib.util.find_spec("dateutil")),
+        #     "requests": requests_ok,
+        #     "yaml": yaml_ok,
+        #     "dateutil": _has_module("dateutil"),
         # },
         "spring-boot-generator": {
-            "requests": True,
-            "yaml": True,
-            "openapi-generator-cli": bool(shutil.which("openapi-generator-cli")),
-            "npm": bool(shutil.which("npm")),
+            "requests": requests_ok,
+            "yaml": yaml_ok,
+            "openapi-generator-cli": openapi_generator_ok,
+            "npm": npm_ok,
         },
         "time-tracker": {
             "json": True,
@@ -169,35 +356,25 @@ def validate_mcp_dependencies() -> Dict[str, Dict[str, bool]]:
             "datetime": True,
         },
         "terminal": {
-            "uvx": bool(shutil.which("uvx")) or bool(shutil.which("uv")),
+            "uvx": uvx_ok or uv_ok,
         },
         "memory": {
-            "npm": bool(shutil.which("npm")),
+            "npm": npm_ok,
         },
         "tavily": {
-            "npm": bool(shutil.which("npm")),
+            "npm": npm_ok,
         },
         # "gmail": {
-        #     "npm": bool(shutil.which("npm")),
+        #     "npm": npm_ok,
         # },
         "github": {
-            "npm": bool(shutil.which("npm")),
+            "npm": npm_ok,
         },
         "filesystem": {
-            "npm": bool(shutil.which("npm")),
+            "npm": npm_ok,
         },
     }
 
-    for server, deps in dependencies.items():
-        for dep, status in list(deps.items()):
-            if dep in ["cryptography", "requests", "yaml", "dateutil"]:
-                if dep == "yaml":
-                    deps[dep] = bool(importlib.util.find_spec("yaml"))
-                elif dep == "requests":
-                    deps[dep] = bool(importlib.util.find_spec("requests"))
-
-    return dependencies
-
 
 def validate_config_structure() -> bool:
     """Validate the structure of fastagent.config.yaml"""
@@ -207,8 +384,7 @@ def validate_config_structure() -> bool:
         return False
 
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = config_manager.get_config()
 
         if not isinstance(config, dict):
             log_error("Configuration file must contain a YAML dictionary")
@@ -253,7 +429,7 @@ def validate_config_structure() -> bool:
         log_info("Configuration validation completed")
         return True
 
-    except yaml.YAMLError as e:
+    except _yaml_error() as e:
         log_error("Configuration file contains invalid YAML", exception=e)
         return False
     except Exception as e:
@@ -261,6 +437,17 @@ def validate_config_structure() -> bool:
         return False
 
 
+# Install hints logged when a server is missing one of these dependencies
+MISSING_DEPENDENCY_HINTS = {
+    "spring-boot-generator": {
+        "openapi-generator-cli": "Spring Boot Generator may fail - install with: npm install -g @openapitools/openapi-generator-cli",
+    },
+    # "google-calendar": {
+    #     "dateutil": "Google Calendar date parsing will be limited - install with: pip install python-dateutil",
+    # },
+}
+
+
 def log_dependency_status():
     """Log the status of MCP server dependencies."""
     deps = validate_mcp_dependencies()
@@ -272,12 +459,8 @@ def log_dependency_status():
         missing = [dep for dep, available in server_deps.items() if not available]
         if missing:
             missing_deps.append(f"{server}: {', '.join(missing)}")
-
-            if server == "spring-boot-generator" and "openapi-generator-cli" in missing:
-                warnings.append("Spring Boot Generator may fail - install with: npm install -g @openapitools/openapi-generator-cli")
-
-            # if server == "google-calendar" and "dateutil" in missing:
-            #     warnings.append("Google Calendar date parsing will be limited - install with: pip install python-dateutil")
+            hints = MISSING_DEPENDENCY_HINTS.get(server, {})
+            warnings.extend(hints[dep] for dep in missing if dep in hints)
 
     if missing_deps:
         log_warning("Some MCP servers have missing dependencies", context={"missing": missing_deps})
@@ -287,71 +470,48 @@ def log_dependency_status():
         log_info("All MCP server dependencies are available")
 
 
+# MCP servers the maestro agent routes to
+MAESTRO_SERVERS = (
+    "filesystem",
+    "tavily",
+    "terminal",
+    "memory",
+    "github",
+    "spring-boot-generator",
+    "spotify",
+    "time-tracker",
+)
+
+
+def _maestro_servers() -> list:
+    """MAESTRO_SERVERS that fastagent.config.yaml can launch, so FastAgent never starts a server whose command is missing"""
+    try:
+        configured = config_manager.get_config()["mcp"]["servers"]
+    except Exception:
+        # Without a readable config FastAgent reports the problem itself
+        return list(MAESTRO_SERVERS)
+    if not isinstance(configured, dict):
+        # Same for an empty or malformed servers section
+        return list(MAESTRO_SERVERS)
+
+    servers = []
+    for name in MAESTRO_SERVERS:
+        server_config = configured.get(name)
+        command = server_config.get("command") if isinstance(server_config, dict) else None
+        if command and not _which(command):
+            log_warning(f"Skipping MCP server '{name}' - command '{command}' not found")
+            continue
+        servers.append(name)
+    return servers
+
+
 fast = FastAgent("Europa")
 
 
 @fast.agent(
     name="maestro",
-    instruction="""You are a high-performance smart maestro that efficiently detects user intent and routes to specialized solutions.
-
-CRITICAL MEMORY HANDLING:
-- The user's name is Samuel - remember this and use it consistently
-- When users ask "what is your name" or "my name", respond with "Your name is Samuel" (not gemini or any model name)
-- ALWAYS search memory first using the Memory MCP server before responding to personal questions
-- Store important user information in memory for future reference
-- Distinguish between: USER (Samuel) vs AI MODEL (gemini-2.0-flash-exp) vs SYSTEM (Europa)
-
-OPTIMIZED ROUTING LOGIC:
-
-1. File Operations (Async I/O):
-   - Keywords: "file", "directory", "save", "read", "list", "organize"
-   - Action: Use Filesystem MCP server with async file operations
-
-2. Web Search & Research:
-   - Keywords: "search", "find", "lookup", "research", "web", "news"
-   - Action: Use Tavily AI search server optimized for AI agents and LLMs
-
-3. Terminal Operations:
-   - Keywords: "run", "execute", "command", "terminal", "bash", "shell", "ls", "cat"
-   - Action: Use secure terminal controller for safe command execution
-
-4. Memory & Knowledge:
-   - Keywords: "remember", "store", "recall", "forget", "what did I", "my preferences", "save this", "my name", "who am I"
-   - Action: Use Memory MCP server - ALWAYS search memory first for user info, then store new information
-
-5. GitHub & Repository Management:
-   - Keywords: "repo", "repository", "github", "commit", "push", "branch", "issue", "pull request", "PR", "create repo"
-   - Action: Use GitHub MCP server for repository creation, file management, and GitHub operations
-
-6. Music Control:
-   - Keywords: "play", "music", "song", "spotify", "skip", "pause", "volume", "track", "artist", "album", "playlist"
-   - Action: Use Spotify MCP server for music playback control, search, and playlist management
-
-7. Time Tracking:
-   - Keywords: "timer", "time", "hours", "log", "track", "start", "stop", "work", "project", "timesheet", "summary"
-   - Action: Use Time Tracker MCP server for work hour logging, timer management, and reporting
-
-8. Spring Boot Development:
-   - Keywords: "spring boot", "java", "generate", "project", "maven", "openapi", "swagger"
-   - Action: Use Spring Boot Generator MCP server for project scaffolding and code generation
-
-PERFORMANCE OPTIMIZATIONS:
-- Concurrent operation handling
-- Response caching for repeated requests
-- Connection pooling for databases and APIs
-- Lazy loading of heavy resources
-- Efficient memory usage patterns
-""",
-    servers=[
-        "filesystem",
-        "tavily",
-        "terminal",
-        "memory",
-        "github",
-        "spring-boot-generator",
-        "spotify",
-        "time-tracker",
-    ],
+    instruction=MAESTRO_INSTRUCTION,
+    servers=_maestro_servers(),
     model="google.gemini-2.0-flash-exp",
     request_params=RequestParams(
         temperature=0.1,  # Lower temperature for faster, more deterministic responses
@@ -362,31 +522,79 @@ async def europa():
     pass
 
 
+def _cached_check(env_key: str, check: Callable[[], bool]) -> bool:
+    """Run a startup check, unless the process that re-exec'd this one passed its result down"""
+    # Popped, so the result never reaches MCP servers or later tmux panes and goes stale there
+    cached = os.environ.pop(env_key, None)
+    if cached is not None:
+        return cached == "1"
+    return check()
+
+
+def _tmux_available() -> bool:
+    """Whether a working tmux binary is on the PATH"""
+    import subprocess
+
+    try:
+        # Only the exit status matters, so the output goes to /dev/null instead of through pipes
+        subprocess.run(["tmux", "-V"], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
 def setup_f1_split_terminal():
     """Set up 2-pane terminal: coordinator (left), F1 display (right)"""
-    try:
-        subprocess.run(["tmux", "-V"], capture_output=True, check=True)
+    import subprocess
+
+    if _cached_check("EUROPA_TMUX_OK", _tmux_available):
         log_info("tmux detected - setting up F1 split terminal")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         log_warning("tmux not available - F1 split disabled")
         print("tmux not available - F1 split disabled")
         return False
 
+    f1_path_exists = _cached_check("EUROPA_F1_PATH_OK", lambda: os.path.isdir(F1_PATH))
+
     if os.environ.get("TMUX"):
         try:
-            f1_path = PROJECT_ROOT / "f1-mcp"
-            if not f1_path.exists():
+            if not f1_path_exists:
                 log_warning("f1-mcp directory not found - F1 split disabled")
                 return False
 
-            subprocess.run(["tmux", "split-window", "-h", "-c", str(f1_path)], check=True)
-
-            subprocess.run(["tmux", "send-keys", "-t", "1", "./f1_display.sh", "C-m"], check=True)
-
-            subprocess.run(["tmux", "select-pane", "-t", "0", "-T", "MCP Coordinator"], check=True)
-            subprocess.run(["tmux", "select-pane", "-t", "1", "-T", "F1 Display"], check=True)
-
-            subprocess.run(["tmux", "select-pane", "-t", "0"], check=True)
+            # One tmux client call for the whole layout, with ";" separating the commands like the new-session call below
+            subprocess.run(
+                [
+                    "tmux",
+                    "split-window",
+                    "-h",
+                    "-c",
+                    F1_PATH,
+                    ";",
+                    "send-keys",
+                    "-t",
+                    "1",
+                    "./f1_display.sh",
+                    "C-m",
+                    ";",
+                    "select-pane",
+                    "-t",
+                    "0",
+                    "-T",
+                    "MCP Coordinator",
+                    ";",
+                    "select-pane",
+                    "-t",
+                    "1",
+                    "-T",
+                    "F1 Display",
+                    ";",
+                    "select-pane",
+                    "-t",
+                    "0",
+                ],
+                check=True,
+            )
 
             log_info("F1 display started successfully in right pane")
             print("F1 display started in right pane!")
@@ -397,18 +605,21 @@ def setup_f1_split_terminal():
             return False
 
     else:
+        split_created = os.environ.get("F1_SPLIT_CREATED")
         try:
             subprocess.run(["tmux", "kill-session", "-t", "f1-europa"], capture_output=True)
 
-            env = os.environ.copy()
-            env["F1_SPLIT_CREATED"] = "1"
+            # The check results go on the command line of the re-exec'd europa only, not into the tmux environment
+            europa_command = f"EUROPA_TMUX_OK=1 EUROPA_F1_PATH_OK={int(f1_path_exists)} uv run {__file__}"
 
-            f1_path = PROJECT_ROOT / "f1-mcp"
-            if not f1_path.exists():
+            # exec replaces this process, so the new session can inherit the live environment instead of a copy
+            os.environ["F1_SPLIT_CREATED"] = "1"
+
+            if not f1_path_exists:
                 log_warning("f1-mcp directory not found - creating tmux session without F1 split")
-                os.execvpe("tmux", ["tmux", "new-session", "-s", "f1-europa", "-c", str(PROJECT_ROOT), f"uv run {__file__}"], env)
+                os.execvp("tmux", ["tmux", "new-session", "-s", "f1-europa", "-c", path_str, europa_command])
             else:
-                os.execvpe(
+                os.execvp(
                     "tmux",
                     [
                         "tmux",
@@ -416,13 +627,13 @@ def setup_f1_split_terminal():
                         "-s",
                         "f1-europa",
                         "-c",
-                        str(PROJECT_ROOT),
-                        f"uv run {__file__}",
+                        path_str,
+                        europa_command,
                         ";",
                         "split-window",
                         "-h",
                         "-c",
-                        str(f1_path),
+                        F1_PATH,
                         "./f1_display.sh",
                         ";",
                         "select-pane",
@@ -438,68 +649,60 @@ def setup_f1_split_terminal():
                         "pane-exited",
                         "kill-session",
                     ],
-                    env,
                 )
 
         except Exception as e:
+            # The exec did not happen, so this process keeps running with its environment as it was
+            if split_created is None:
+                os.environ.pop("F1_SPLIT_CREATED", None)
+            else:
+                os.environ["F1_SPLIT_CREATED"] = split_created
             log_error("Failed to create F1 tmux session", exception=e)
             print("Falling back to europa without split terminal")
             return False
 
 
-async def async_validate_config_structure():
-    """Async wrapper for config validation"""
-    return validate_config_structure()
-
+async def _count_tmux_panes() -> int:
+    """Number of panes in the tmux window europa runs in"""
+    # tmux reports the count itself, rather than one line per pane to be counted here.
+    # Without a target it would describe the client's active window, which need not be ours
+    target = ["-t", os.environ["TMUX_PANE"]] if os.environ.get("TMUX_PANE") else []
+    proc = await asyncio.create_subprocess_exec(
+        "tmux", "display-message", *target, "-p", "#{window_panes}", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    stdout, _ = await proc.communicate()
+    return int(stdout.strip() or 0)
 
-async def async_log_dependency_status():
-    """Async wrapper for dependency validation"""
-    return log_dependency_status()
 
+async def async_validate_config_structure():
+    """Async wrapper for config validation, run in a worker thread"""
+    return await asyncio.to_thread(validate_config_structure)
 
-@catch_and_log(shutdown_on_error=False)
-async def startup_tasks():
-    """Perform startup tasks with error handling"""
-    log_info("Starting Europa startup tasks")
 
-    # Run validation tasks concurrently
-    validation_tasks = [
-        asyncio.create_task(async_validate_config_structure()),
-        asyncio.create_task(async_log_dependency_status()),
-    ]
-
-    # Execute validation tasks concurrently
-    validation_results = await asyncio.gather(*validation_tasks, return_exceptions=True)
+async def async_log_dependency_status():
+    """Async wrapper for dependency validation, run in a worker thread"""
+    return await asyncio.to_thread(log_dependency_status)
 
-    # Process results
-    for i, result in enumerate(validation_results):
-        task_name = ["config_validation", "dependency_validation"][i]
-        if isinstance(result, Exception):
-            log_warning(f"{task_name} failed", context={"error": str(result)})
-        else:
-            log_info(f"{task_name} completed successfully")
 
-    # Add log rotation to async tasks
-    async def async_log_rotation():
-        """Async wrapper for log rotation"""
-        try:
-            log_manager.rotate_logs(max_age_days=1, max_size_mb=50)
-            log_info("Log rotation completed")
-            return True
-        except Exception as e:
-            log_warning("Log rotation failed", context={"error": str(e)})
-            return False
+async def async_log_rotation():
+    """Async wrapper for log rotation, run in a worker thread"""
+    try:
+        await asyncio.to_thread(log_manager.rotate_logs, max_age_days=1, max_size_mb=50)
+        log_info("Log rotation completed")
+        return True
+    except Exception as e:
+        log_warning("Log rotation failed", context={"error": str(e)})
+        return False
 
-    # Run log rotation concurrently with other tasks
-    maintenance_tasks = [asyncio.create_task(async_log_rotation())]
 
+async def async_setup_f1_split():
+    """Open the F1 display pane when running in a single-pane tmux window"""
     if os.environ.get("TMUX") and not os.environ.get("F1_SPLIT_CREATED"):
         try:
-            result = subprocess.run(["tmux", "list-panes", "-F", "#{pane_id}"], capture_output=True, text=True)
-            pane_count = len(result.stdout.strip().split("\n")) if result.stdout.strip() else 0
+            pane_count = await _count_tmux_panes()
             if pane_count == 1:
                 log_info("Single tmux pane detected - attempting F1 split")
-                f1_split_enabled = setup_f1_split_terminal()
+                f1_split_enabled = await asyncio.to_thread(setup_f1_split_terminal)
                 if f1_split_enabled:
                     log_info("F1 split terminal setup successful")
                 else:
@@ -509,26 +712,49 @@ async def startup_tasks():
     elif os.environ.get("F1_SPLIT_CREATED"):
         log_info("F1 split already created in previous session")
 
-    # Run maintenance tasks concurrently
-    if maintenance_tasks:
-        log_info(f"Running {len(maintenance_tasks)} maintenance tasks")
-        maintenance_results = await asyncio.gather(*maintenance_tasks, return_exceptions=True)
 
-        for i, result in enumerate(maintenance_results):
-            task_name = ["log_rotation"][i]
-            if isinstance(result, Exception):
-                log_error(f"Maintenance task {task_name} failed", exception=result)
-            else:
-                log_info(f"Maintenance task {task_name} completed successfully")
+@catch_and_log(shutdown_on_error=False)
+async def startup_tasks():
+    """Perform startup tasks with error handling"""
+    log_info("Starting Europa startup tasks")
+
+    # None of these depend on each other, so they run as one wave with their blocking
+    # file and tmux work in worker threads
+    startup_task_names = ["config_validation", "dependency_validation", "log_rotation", "f1_split"]
+    tasks = [
+        asyncio.create_task(async_validate_config_structure()),
+        asyncio.create_task(async_log_dependency_status()),
+        asyncio.create_task(async_log_rotation()),
+        asyncio.create_task(async_setup_f1_split()),
+    ]
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task_name, result in zip(startup_task_names, results):
+        if isinstance(result, Exception):
+            log_warning(f"{task_name} failed", context={"error": str(result)})
+        else:
+            log_info(f"{task_name} completed successfully")
 
     log_info("Startup tasks completed")
 
 
+def _log_health_report(task: "asyncio.Task[str]"):
+    """Log the outcome of the background health report"""
+    if task.cancelled():
+        return
+    exception = task.exception()
+    if exception is not None:
+        log_warning("Health report failed", context={"error": str(exception)})
+        return
+    log_info("Generated health report", context={"report_lines": task.result().count("\n") + 1})
+
+
 @catch_and_log(shutdown_on_error=True, delay_seconds=5)
 async def main():
     """Main application entry point with comprehensive error handling"""
     try:
-        weather_info = get_simple_weather()
+        weather_info = get_startup_weather()
         startup_msg = f"Europa — built on FastAgent MCP v{__version__} | {weather_info}"
         print(startup_msg)
         print()
@@ -545,8 +771,9 @@ async def main():
 
         await startup_tasks()
 
-        health_report = log_manager.generate_health_report()
-        log_info("Generated health report", context={"report_lines": len(health_report.split("\n"))})
+        # Nothing waits on the health report, so it is built in the background instead of delaying the session
+        health_report_task = asyncio.create_task(asyncio.to_thread(log_manager.generate_health_report))
+        health_report_task.add_done_callback(_log_health_report)
 
         log_info("Starting FastAgent interactive session")
         async with fast.run() as agent:
@@ -562,6 +789,7 @@ async def main():
         persistent_logger.log_shutdown("fatal_error", 1)
         raise
     finally:
+        await close_monitoring()
         log_info("Main application cleanup complete")
 
 
@@ -4,18 +4,29 @@ Version information for Europa — built on FastAgent MCP
 This file dynamically reads version from pyproject.toml to avoid duplication.
 """
 
+import re
 from pathlib import Path
 
-import tomllib
+# [project] table and the plain `version = "..."` line in it, the common layout a full TOML parse is not needed for
+_PROJECT_TABLE_RE = re.compile(rb"^\[project\][ \t]*$(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+_VERSION_RE = re.compile(rb'^version[ \t]*=[ \t]*"([^"\\]+)"', re.MULTILINE)
 
 
 def _get_version_from_pyproject():
     """Read version from pyproject.toml"""
     try:
         pyproject_path = Path(__file__).parent / "pyproject.toml"
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
-        return data["project"]["version"]
+        content = pyproject_path.read_bytes()
+
+        table = _PROJECT_TABLE_RE.search(content)
+        match = _VERSION_RE.search(table.group(1)) if table else None
+        if match:
+            return match.group(1).decode("utf-8")
+
+        # Anything else (a literal string, a dotted key, a multi-line table) gets the real parser
+        import tomllib
+
+        return tomllib.loads(content.decode("utf-8"))["project"]["version"]
     except Exception:
         return "0.0.0"
 
@@ -24,11 +35,10 @@ __version__ = _get_version_from_pyproject()
 
 VERSION = __version__
 
-# Parse version components
-version_parts = __version__.split(".")
-VERSION_MAJOR = int(version_parts[0]) if len(version_parts) > 0 else 0
-VERSION_MINOR = int(version_parts[1]) if len(version_parts) > 1 else 0
-VERSION_PATCH = int(version_parts[2]) if len(version_parts) > 2 else 0
+# Parse version components from the numeric release part, so suffixes like "rc1" or ".dev0" are ignored
+_release = re.match(r"\d+(?:\.\d+)*", __version__)
+_release_parts = tuple(int(part) for part in _release.group().split(".")) if _release else ()
+VERSION_MAJOR, VERSION_MINOR, VERSION_PATCH = (_release_parts + (0, 0, 0))[:3]
 
 VERSION_TUPLE = (VERSION_MAJOR, VERSION_MINOR, VERSION_PATCH)
 
@@ -4,75 +4,291 @@ Simple weather module for Europa startup display.
 Provides current weather based on IP geolocation.
 """
 
-from typing import Optional
+import functools
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
-import requests
+# Responses are kept on disk so a warm start shows the weather without waiting on the network
+CACHE_FILE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "europa" / "weather.json"
+# Decimal places coordinates are rounded to for weather, 1 is a cell of about 11 km
+COORDINATE_DECIMALS = 1
+LOCATION_TTL = 24 * 60 * 60  # seconds, the IP location rarely moves
+WEATHER_TTL = 10 * 60  # seconds
+# Freshness of new entries from how long the lookup took: (base, seconds added per second taken, max)
+LOCATION_TTL_POLICY = (12 * 60 * 60, 12 * 60 * 60, 48 * 60 * 60)
+WEATHER_TTL_POLICY = (5 * 60, 5 * 60, 30 * 60)
+WEATHER_STALE_TTL = 3 * 60 * 60  # seconds an outdated reading is still shown at startup while it is refreshed
+FAILURE_TTL = 60  # seconds a failed lookup is remembered, so an outage does not cost every start its timeouts
+# (connect, read) timeouts per request and the most get_simple_weather waits overall, in seconds
+LOCATION_TIMEOUT = (0.8, 1.5)
+WEATHER_TIMEOUT = (0.8, 2.0)
+WEATHER_BUDGET = 3.0
+# Fetch weather for the last known location while the location itself is being looked up
+WEATHER_PREFETCH = os.environ.get("EUROPA_WEATHER_PREFETCH", "1") != "0"
 
+_cache_lock = threading.Lock()
+# Lookups in progress, by key, for _singleflight
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 
+
+@functools.cache
+def _get_session():
+    """One session for all lookups, so a second request to the same host reuses its connection
+
+    requests is imported here, so a start served from the cache never loads it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Room for the parallel location lookups plus the weather calls running next to them
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+
+def _cache_load() -> dict:
+    """Read the whole cache file, empty when it is missing or unreadable"""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _cache_get(key: str, ttl: Optional[float], stored_ttl: bool = False) -> Optional[Any]:
+    """Cached value for key if younger than ttl seconds, any age when ttl is None
+
+    With stored_ttl, the TTL saved with the entry is used instead, and ttl only for entries saved without one.
+    """
+    entry = _cache_load().get(key)
+    if not isinstance(entry, dict) or "value" not in entry:
+        return None
+    if stored_ttl:
+        ttl = entry.get("ttl", ttl)
+    if ttl is not None and time.time() - entry.get("ts", 0) >= ttl:
+        return None
+    return entry["value"]
+
+
+def _adaptive_ttl(policy: tuple, elapsed: float) -> float:
+    """TTL for a response that took elapsed seconds, from a (base, per_second, max) policy
+
+    A slow answer suggests a loaded server, so it is kept longer before asking again.
+    """
+    base, per_second, longest = policy
+    return min(longest, base + per_second * elapsed)
+
+
+def _cache_set(key: str, value: Any, ttl: Optional[float] = None):
+    """Store value under key, with the TTL it stays fresh for if given, replacing the cache file atomically"""
+    # One entry per kind ("location", "weather"), so weather for places left behind does not pile up
+    kind = key.split(":", 1)[0]
+    tmp_file = CACHE_FILE.with_name(CACHE_FILE.name + ".tmp")
+    # Location and weather can be stored from different threads, each rewriting the whole file
+    with _cache_lock:
+        cache = {k: v for k, v in _cache_load().items() if k.split(":", 1)[0] != kind}
+        cache[key] = {"value": value, "ts": time.time()}
+        if ttl is not None:
+            cache[key]["ttl"] = ttl
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, CACHE_FILE)
+        except (OSError, TypeError, ValueError):
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+
+def _singleflight(key_fn: Callable[..., str]):
+    """Let concurrent calls with the same key share one run of the function instead of each going to the network"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = key_fn(*args)
+            with _inflight_lock:
+                future = _inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = _inflight[key] = Future()
+            if not leader:
+                return future.result()
+
+            try:
+                result = func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                with _inflight_lock:
+                    del _inflight[key]
+
+        return wrapper
+
+    return decorator
+
+
+def _fetch_location(api: str) -> Optional[dict]:
+    """Location from one IP geolocation API, None if it fails or has no city"""
+    try:
+        response = _get_session().get(api, timeout=LOCATION_TIMEOUT)
+        data = response.json()
+    except Exception:
+        return None
+
+    if "city" not in data:
+        return None
+
+    # ipinfo.io sends "loc", ipapi.co separate coordinates, either can answer first
+    loc = data.get("loc")
+    if not loc and "latitude" in data and "longitude" in data:
+        loc = f"{data['latitude']},{data['longitude']}"
+    return {
+        "city": data.get("city", "Unknown"),
+        "country": data.get("country", data.get("country_name", "XX")),
+        "loc": loc or "51.5074,-0.1278",
+    }
+
+
+@_singleflight(lambda: "location")
 def get_location() -> Optional[dict]:
     """Get user location from IP with multiple fallbacks."""
+    cached = _cache_get("location", LOCATION_TTL, stored_ttl=True)
+    if cached:
+        return cached
+
+    # Right after a failed lookup the network is not tried again, the fallback below is returned at once
+    if not _cache_get("location_failed", FAILURE_TTL):
+        started = time.perf_counter()
+        location = _lookup_location()
+        if location:
+            _cache_set("location", location, _adaptive_ttl(LOCATION_TTL_POLICY, time.perf_counter() - started))
+            return location
+        _cache_set("location_failed", True)
+
+    # Offline: a stale location is still closer than the default
+    return _cache_get("location", None) or {"city": "London", "country": "GB", "loc": "51.5074,-0.1278"}
+
+
+def _lookup_location() -> Optional[dict]:
+    """Location from the first IP geolocation API to answer with a city"""
     apis = ["https://ipinfo.io/json", "https://ipapi.co/json", "https://httpbin.org/ip"]
 
-    for api in apis:
-        try:
-            response = requests.get(api, timeout=2)
-            data = response.json()
+    # All APIs are asked at once and the first answer with a city wins, instead of waiting out each timeout in turn
+    pool = ThreadPoolExecutor(max_workers=len(apis))
+    try:
+        for future in as_completed([pool.submit(_fetch_location, api) for api in apis]):
+            location = future.result()
+            if location:
+                return location
+    finally:
+        # The slower requests finish in the background, bounded by their own timeout
+        pool.shutdown(wait=False)
+    return None
+
 
-            if "city" in data:
-                return {
-                    "city": data.get("city", "Unknown"),
-                    "country": data.get("country", data.get("country_name", "XX")),
-                    "loc": data.get("loc", "51.5074,-0.1278"),
-                }
-        except Exception:
-            continue
+# wttr.in one-line format "%C|%t" in metric units ("m"), e.g. "Partly cloudy|+12°C", percent-encoded
+WTTR_LINE_QUERY = "format=%25C%7C%25t&m"
+_WTTR_LINE_RE = re.compile(r"(?P<condition>[^|\n]+)\|(?P<temp>[+-]?\d+)°C")
 
-    return {"city": "London", "country": "GB", "loc": "51.5074,-0.1278"}
 
+def _fetch_weather(lat: str, lon: str) -> Any:
+    """Current condition from wttr.in, shaped like its j1 JSON report
 
+    Only the condition and temperature are shown, so the one-line format is asked for
+    instead of the j1 report, which is tens of kilobytes of forecast.
+    """
+    session = _get_session()
+    response = session.get(f"https://wttr.in/{lat},{lon}?{WTTR_LINE_QUERY}", timeout=WEATHER_TIMEOUT)
+    match = _WTTR_LINE_RE.fullmatch(response.text.strip())
+    if match:
+        return {
+            "current_condition": [
+                {"temp_C": match["temp"].lstrip("+"), "weatherDesc": [{"value": match["condition"].strip()}]},
+            ]
+        }
+
+    # Anything else (an error page, a changed format) gets the full report
+    response = session.get(f"https://wttr.in/{lat},{lon}?format=j1", timeout=WEATHER_TIMEOUT)
+    return response.json()
+
+
+@_singleflight(lambda lat, lon: f"weather:{lat},{lon}")
 def get_weather_data(lat: str, lon: str) -> Optional[dict]:
     """Get weather data from wttr.in API."""
+    cache_key = f"weather:{lat},{lon}"
+    cached = _cache_get(cache_key, WEATHER_TTL, stored_ttl=True)
+    if cached:
+        return cached
+
+    if _cache_get("weather_failed", FAILURE_TTL):
+        return _cache_get(cache_key, None)
+
+    started = time.perf_counter()
     try:
-        response = requests.get(f"https://wttr.in/{lat},{lon}?format=j1", timeout=3)
-        return response.json()
+        weather_data = _fetch_weather(lat, lon)
     except Exception:
-        return None
+        _cache_set("weather_failed", True)
+        # Offline: stale weather beats none
+        return _cache_get(cache_key, None)
 
+    if isinstance(weather_data, dict):
+        _cache_set(cache_key, weather_data, _adaptive_ttl(WEATHER_TTL_POLICY, time.perf_counter() - started))
+    return weather_data
 
-def get_weather_emoji(condition: str) -> str:
-    """Get emoji for weather condition."""
-    condition_lower = condition.lower()
-
-    emoji_map = {
-        "clear": "☀️",
-        "sunny": "☀️",
-        "partly cloudy": "⛅",
-        "partly_cloudy": "⛅",
-        "cloudy": "☁️",
-        "overcast": "☁️",
-        "mist": "🌫️",
-        "fog": "🌫️",
-        "light rain": "🌦️",
-        "rain": "🌧️",
-        "heavy rain": "🌧️",
-        "drizzle": "🌦️",
-        "shower": "🌦️",
-        "thunderstorm": "⛈️",
-        "thunder": "⛈️",
-        "snow": "❄️",
-        "light snow": "🌨️",
-        "heavy snow": "❄️",
-        "sleet": "🌨️",
-        "hail": "🌨️",
-        "windy": "💨",
-        "breezy": "🍃",
-    }
 
-    for key, emoji in emoji_map.items():
-        if key in condition_lower:
-            return emoji
+# (keyword, emoji) pairs for weather conditions, multi-word keywords before the single words
+# they start with or contain ("light snow" before "snow")
+WEATHER_EMOJIS = (
+    ("partly cloudy", "⛅"),
+    ("partly_cloudy", "⛅"),
+    ("light rain", "🌦️"),
+    ("heavy rain", "🌧️"),
+    ("light snow", "🌨️"),
+    ("heavy snow", "❄️"),
+    ("thunderstorm", "⛈️"),
+    ("thunder", "⛈️"),
+    ("clear", "☀️"),
+    ("sunny", "☀️"),
+    ("cloudy", "☁️"),
+    ("overcast", "☁️"),
+    ("mist", "🌫️"),
+    ("fog", "🌫️"),
+    ("rain", "🌧️"),
+    ("drizzle", "🌦️"),
+    ("shower", "🌦️"),
+    ("snow", "❄️"),
+    ("sleet", "🌨️"),
+    ("hail", "🌨️"),
+    ("windy", "💨"),
+    ("breezy", "🍃"),
+)
+# One pass over the condition instead of a substring scan per keyword. The lookahead reports a match
+# at every position, overlapping ones included, and the earliest keyword in the table wins as in an
+# ordered scan; at a single position the alternation already tries the keywords in table order
+_WEATHER_EMOJI_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword, _ in WEATHER_EMOJIS) + "))")
+_WEATHER_EMOJI_RANK = {keyword: (rank, emoji) for rank, (keyword, emoji) in enumerate(WEATHER_EMOJIS)}
 
-    return "🌤️"
+
+def get_weather_emoji(condition: str) -> str:
+    """Get emoji for weather condition."""
+    best = min((_WEATHER_EMOJI_RANK[match.group(1)] for match in _WEATHER_EMOJI_RE.finditer(condition.lower())), default=None)
+    return best[1] if best else "🌤️"
 
 
 def format_weather_info(location: dict, weather_data: dict) -> str:
@@ -88,16 +304,40 @@ def format_weather_info(location: dict, weather_data: dict) -> str:
         return f"{location['city']}, {location['country']} Weather unavailable"
 
 
-def get_simple_weather() -> str:
-    """Get simple weather info for startup display."""
+def _coordinates(location: dict) -> tuple:
+    """(lat, lon) strings from a location's "loc" field, snapped to the COORDINATE_DECIMALS grid
+
+    Weather is the same across a grid cell, so nearby or jittering locations share a cache
+    entry, and a wttr.in URL its edge cache has seen.
+    """
+    lat, lon = location["loc"].split(",")
+    return f"{float(lat):.{COORDINATE_DECIMALS}f}", f"{float(lon):.{COORDINATE_DECIMALS}f}"
+
+
+def _weather_line() -> str:
+    """Weather line for the startup display, without the overall time limit"""
     try:
-        location = get_location()
+        previous = _cache_get("location", None) if WEATHER_PREFETCH else None
+        if not previous:
+            location = get_location()
+            weather_data = None
+        else:
+            # Usually the location has not moved, so its weather is fetched in parallel with the lookup
+            pool = ThreadPoolExecutor(max_workers=2)
+            try:
+                location_future = pool.submit(get_location)
+                weather_future = pool.submit(get_weather_data, *_coordinates(previous))
+                location = location_future.result()
+                weather_data = weather_future.result() if location and _coordinates(location) == _coordinates(previous) else None
+            finally:
+                # A prefetch for a location left behind is not waited for
+                pool.shutdown(wait=False)
+
         if not location:
             return "Weather unavailable"
 
-        lat, lon = location["loc"].split(",")
-
-        weather_data = get_weather_data(lat.strip(), lon.strip())
+        if weather_data is None:
+            weather_data = get_weather_data(*_coordinates(location))
         if not weather_data:
             return f"{location['city']}, {location['country']} Weather unavailable"
 
@@ -107,5 +347,42 @@ def get_simple_weather() -> str:
         return "Weather unavailable"
 
 
+def get_simple_weather() -> str:
+    """Get simple weather info for startup display."""
+    # Startup waits at most WEATHER_BUDGET, however the individual request timeouts add up
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        return pool.submit(_weather_line).result(timeout=WEATHER_BUDGET)
+    except FuturesTimeoutError:
+        return "Weather unavailable"
+    finally:
+        pool.shutdown(wait=False)
+
+
+def get_startup_weather() -> str:
+    """Weather line for the startup banner, shown from the cache while a refresh runs in the background
+
+    A cached reading up to WEATHER_STALE_TTL old is returned at once. When it is past
+    its TTL, a daemon thread fetches a fresh one into the cache for the next start.
+    Without a usable reading this falls back to get_simple_weather.
+    """
+    try:
+        location = _cache_get("location", None)
+        if location:
+            weather_key = "weather:{},{}".format(*_coordinates(location))
+            weather_data = _cache_get(weather_key, WEATHER_STALE_TTL)
+            if weather_data:
+                if (
+                    _cache_get(weather_key, WEATHER_TTL, stored_ttl=True) is None
+                    or _cache_get("location", LOCATION_TTL, stored_ttl=True) is None
+                ):
+                    threading.Thread(target=_weather_line, name="weather-refresh", daemon=True).start()
+                return format_weather_info(location, weather_data)
+    except Exception:
+        # A cache entry that does not parse is simply not used
+        pass
+    return get_simple_weather()
+
+
 if __name__ == "__main__":
     print(get_simple_weather())